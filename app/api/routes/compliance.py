@@ -8,16 +8,25 @@ Implements:
 - GET /compliance/data-retention-report (GDPR Article 5 - Storage Limitation)
 """
 
-from datetime import datetime, timedelta
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import select
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import batched
+from typing import Annotated, Literal
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import and_, case, func, or_
+from sqlmodel import Session, select
 
 from app.api.dependencies import SessionDep
-from app.core.cache import get_cache_service
+from app.core.cache import CATEGORIES_CACHE_KEY, get_cache_service
+from app.core.categories import get_cached_categories, refresh_category_cache
+from app.core.database import engine
 from app.core.logging import get_logger
 from app.core.rbac import (
+    can_access_full_compliance_data,
     can_view_data_inventory,
     can_view_employee_data_about_me,
     can_view_retention_reports,
@@ -28,6 +37,7 @@ from app.core.rbac import (
 from app.core.security import TokenData, get_current_active_user
 from app.models.data_inventory import DataCategory, DataInventory
 from app.models.employee_data_access import DataRetention, EmployeeDataAccess
+from app.schemas.employee import DataInventoryResponse
 
 logger = get_logger(__name__)
 
@@ -36,33 +46,137 @@ router = APIRouter(
     prefix="/compliance",
     tags=["compliance"],
     responses={404: {"description": "Resource not found"}},
+    default_response_class=ORJSONResponse,
 )
 
+# Retention status buckets reported by the data retention report
+RETENTION_STATUS_BUCKETS = ("active", "expiring_soon", "expired", "deleted")
+
+# Summary category for retention records whose inventory row is missing
+UNKNOWN_CATEGORY = "unknown"
+
+# Token roles mapped to the primary role they grant, highest precedence first
+PRIMARY_ROLE_PRECEDENCE = (
+    ("HR_Admin", "HR_Admin"),
+    ("admin", "HR_Admin"),
+    ("HR_Manager", "HR_Manager"),
+    ("manager", "manager"),
+)
+
+# Rows fetched per round-trip (and filtered per batch) when streaming items
+RETENTION_STREAM_BATCH_SIZE = 500
+
+
+def _utc_now() -> datetime:
+    """Current UTC time as a naive datetime, matching how records are stored."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 def _get_user_role(user: TokenData) -> str:
     """Extract the primary role from user token."""
-    if "HR_Admin" in user.roles or "admin" in user.roles:
-        return "HR_Admin"
-    elif "HR_Manager" in user.roles:
-        return "HR_Manager"
-    elif "manager" in user.roles:
-        return "manager"
+    roles = set(user.roles)
+    for token_role, primary_role in PRIMARY_ROLE_PRECEDENCE:
+        if token_role in roles:
+            return primary_role
     return "employee"
 
 
 # ========== Data Inventory Endpoints ==========
 
 
-@router.get("/data-inventory", response_model=dict)
-async def get_data_inventory(
+def _build_data_inventory(
+    session: Session,
+    role: str,
+    category_id: int | None,
+    data_type: str | None,
+    cursor_id: int | None,
+    skip: int,
+    limit: int,
+) -> dict:
+    """Query the data inventory and build the report payload visible to a role."""
+    # Build query over the columns used in the response only
+    query = select(
+        DataInventory.id,
+        DataInventory.data_name,
+        DataInventory.description,
+        DataInventory.category_id,
+        DataInventory.data_type,
+        DataInventory.storage_location,
+        DataInventory.purpose_of_processing,
+        DataInventory.legal_basis,
+        DataInventory.retention_days,
+        DataInventory.retention_policy,
+        DataInventory.data_subjects,
+        DataInventory.recipients,
+        DataInventory.third_party_sharing,
+        DataInventory.third_party_recipients,
+        DataInventory.encryption_status,
+        DataInventory.access_control_level,
+        DataInventory.processing_system,
+        DataInventory.created_at,
+        DataInventory.updated_at,
+    )
+
+    if category_id is not None:
+        query = query.where(DataInventory.category_id == category_id)
+
+    if data_type is not None:
+        query = query.where(DataInventory.data_type == data_type)
+
+    # Execute query with keyset pagination (index range scan on the PK)
+    query = query.order_by(DataInventory.id.asc())
+    if cursor_id is not None:
+        query = query.where(DataInventory.id > cursor_id)
+    elif skip:
+        query = query.offset(skip)
+    inventory = session.exec(query.limit(limit)).all()
+
+    # Rows map straight onto the response model, which handles serialization
+    inventory_list = [row._asdict() for row in inventory]
+
+    # Categories are reference data held in process memory
+    categories_list = get_cached_categories()
+
+    return {
+        "count": len(inventory_list),
+        "skip": skip,
+        "limit": limit,
+        "cursor_id": cursor_id,
+        "next_cursor": inventory_list[-1]["id"] if inventory_list else None,
+        "inventory": filter_data_inventory_for_role(inventory_list, role),
+        "categories": categories_list,
+        "gdpr_article": "Article 30 - Records of Processing Activities",
+        "report_generated_at": _utc_now().isoformat(),
+    }
+
+
+def _refresh_data_inventory(role: str, revision: bytes, **filters) -> None:
+    """Rebuild a cached data inventory report in the background."""
+    with Session(engine) as session:
+        result = _build_data_inventory(session, role, **filters)
+    get_cache_service().set_data_inventory(
+        result=result, revision=revision, role=role, **filters
+    )
+
+
+@router.get(
+    "/data-inventory",
+    response_class=Response,
+    responses={200: {"model": DataInventoryResponse}},
+)
+def get_data_inventory(
     session: SessionDep,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
     category_id: int | None = Query(None),
     data_type: str | None = Query(None),
     sensitivity_level: str | None = Query(None),
-    skip: int = Query(0, ge=0),
+    cursor_id: int | None = Query(
+        None, description="Return entries with an ID greater than this cursor"
+    ),
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: Annotated[int, Query(le=1000)] = 100,
-) -> dict:
+) -> Response:
     """
     Get complete map of all data in system.
     GDPR Article 30 - Records of Processing Activities (ROPA).
@@ -82,12 +196,13 @@ async def get_data_inventory(
     - category_id: Filter by category ID
     - data_type: Filter by data type (personal, sensitive, employment, etc.)
     - sensitivity_level: Filter by sensitivity (low, medium, high, critical)
-    - skip: Number of records to skip (default: 0)
+    - cursor_id: Keyset cursor - pass the previous page's next_cursor
+    - skip: Deprecated offset pagination, ignored when cursor_id is set
     - limit: Maximum records to return (default: 100, max: 1000)
 
     Returns:
     - Complete data inventory with metadata
-    - Count and filtering information
+    - Count, filtering and pagination (next_cursor) information
     - Summary statistics
     """
     user_role = _get_user_role(current_user)
@@ -114,19 +229,35 @@ async def get_data_inventory(
 
     # Try to get from cache first
     cache = get_cache_service()
-    cached_result = cache.get_data_inventory(
+    # Keyset pagination takes precedence over the deprecated offset
+    if cursor_id is not None:
+        skip = 0
+
+    # Cache entries are stored per role, already filtered for that role
+    cached_result, revision = cache.get_data_inventory(
         category_id=category_id,
         data_type=data_type,
+        cursor_id=cursor_id,
         skip=skip,
         limit=limit,
+        role=user_role,
     )
 
     if cached_result:
         logger.debug("Returning cached data inventory")
-        # Apply role-based filtering to cached result
-        if "inventory" in cached_result:
-            cached_result["inventory"] = filter_data_inventory_for_role(
-                cached_result["inventory"], user_role
+        cache_key = cache.data_inventory_key(
+            category_id, data_type, cursor_id, skip, limit, user_role
+        )
+        if cache.needs_refresh(cache_key):
+            background_tasks.add_task(
+                _refresh_data_inventory,
+                user_role,
+                revision,
+                category_id=category_id,
+                data_type=data_type,
+                cursor_id=cursor_id,
+                skip=skip,
+                limit=limit,
             )
         log_compliance_access(
             actor_id=current_user.sub,
@@ -135,82 +266,32 @@ async def get_data_inventory(
             target="all",
             allowed=True,
         )
-        return cached_result
-
-    # Build query
-    query = select(DataInventory)
+        # Already serialized at cache time, send it as-is
+        return Response(content=cached_result, media_type="application/json")
 
-    if category_id is not None:
-        query = query.where(DataInventory.category_id == category_id)
-
-    if data_type is not None:
-        query = query.where(DataInventory.data_type == data_type)
-
-    # Execute query with pagination
-    inventory = session.exec(query.offset(skip).limit(limit)).all()
-
-    # Get categories for reference
-    categories = session.exec(select(DataCategory)).all()
-
-    # Build inventory list
-    inventory_list = [
-        {
-            "id": item.id,
-            "data_name": item.data_name,
-            "description": item.description,
-            "category_id": item.category_id,
-            "data_type": item.data_type,
-            "storage_location": item.storage_location,
-            "purpose_of_processing": item.purpose_of_processing,
-            "legal_basis": item.legal_basis,
-            "retention_days": item.retention_days,
-            "retention_policy": item.retention_policy,
-            "data_subjects": item.data_subjects,
-            "recipients": item.recipients,
-            "third_party_sharing": item.third_party_sharing,
-            "third_party_recipients": item.third_party_recipients,
-            "encryption_status": item.encryption_status,
-            "access_control_level": item.access_control_level,
-            "processing_system": item.processing_system,
-            "created_at": item.created_at.isoformat() if item.created_at else None,
-            "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-        }
-        for item in inventory
-    ]
-
-    categories_list = [
-        {
-            "id": cat.id,
-            "name": cat.name,
-            "description": cat.description,
-            "sensitivity_level": cat.sensitivity_level,
-        }
-        for cat in categories
-    ]
-
-    # Build response
-    result = {
-        "count": len(inventory_list),
-        "skip": skip,
-        "limit": limit,
-        "inventory": inventory_list,
-        "categories": categories_list,
-        "gdpr_article": "Article 30 - Records of Processing Activities",
-        "report_generated_at": datetime.utcnow().isoformat(),
-    }
+    result = _build_data_inventory(
+        session,
+        user_role,
+        category_id=category_id,
+        data_type=data_type,
+        cursor_id=cursor_id,
+        skip=skip,
+        limit=limit,
+    )
 
-    # Cache the result
+    # Serialize once for both the cache entry and the response
+    payload = cache.serialize(result)
     cache.set_data_inventory(
-        result=result,
+        result=payload,
+        revision=revision,
         category_id=category_id,
         data_type=data_type,
+        cursor_id=cursor_id,
         skip=skip,
         limit=limit,
+        role=user_role,
     )
 
-    # Apply role-based filtering
-    result["inventory"] = filter_data_inventory_for_role(result["inventory"], user_role)
-
     log_compliance_access(
         actor_id=current_user.sub,
         actor_role=user_role,
@@ -219,14 +300,24 @@ async def get_data_inventory(
         allowed=True,
     )
 
-    return result
+    return Response(content=payload, media_type="application/json")
 
 
 # ========== Employee Data About Me Endpoint ==========
 
 
+def _distinct_data_types(session: Session) -> list[str]:
+    """Distinct data types held in the inventory, cached across requests."""
+    cache = get_cache_service()
+    data_types = cache.get_data_types()
+    if data_types is None:
+        data_types = list(session.exec(select(DataInventory.data_type).distinct()))
+        cache.set_data_types(data_types)
+    return data_types
+
+
 @router.get("/employee/{employee_id}/data-about-me", response_model=dict)
-async def get_employee_data_about_me(
+def get_employee_data_about_me(
     employee_id: str,
     session: SessionDep,
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
@@ -291,54 +382,64 @@ async def get_employee_data_about_me(
         )
         return cached_result
 
-    # Get all data inventory entries
-    all_inventory = session.exec(select(DataInventory)).all()
-
-    # Find retention records for this employee
-    retention_query = select(DataRetention).where(
-        DataRetention.data_subject_id == employee_id
+    # Distinct data types held in the inventory
+    data_type_categories = _distinct_data_types(session)
+
+    # Retention records for this employee paired with their inventory entry
+    retention_query = (
+        select(
+            DataRetention.retention_expires_at,
+            DataInventory.data_name,
+            DataInventory.data_type,
+            DataInventory.retention_days,
+            DataInventory.storage_location,
+            DataInventory.purpose_of_processing,
+        )
+        .select_from(DataRetention)
+        .outerjoin(DataInventory, DataRetention.data_inventory_id == DataInventory.id)
+        .where(DataRetention.data_subject_id == employee_id)
+        .order_by(DataRetention.id.asc())
     )
-    retention_records = session.exec(retention_query).all()
 
-    # Calculate retention summary
+    # Calculate retention summary and earliest deletion date in one pass
+    total_data_entries = 0
+    next_deletion = None
     retention_summary = {}
-    for record in retention_records:
-        inventory = session.get(DataInventory, record.data_inventory_id)
-        if inventory:
-            category_name = inventory.data_name
-            if category_name not in retention_summary:
-                retention_summary[category_name] = {
-                    "data_type": inventory.data_type,
-                    "retention_days": inventory.retention_days,
-                    "deletion_date": (
-                        record.retention_expires_at.isoformat()
-                        if record.retention_expires_at
-                        else None
-                    ),
-                    "storage_location": inventory.storage_location,
-                    "purpose": inventory.purpose_of_processing,
-                }
-
-    # Find earliest deletion date
-    deletion_dates = [
-        r.retention_expires_at for r in retention_records if r.retention_expires_at
-    ]
-    next_deletion = min(deletion_dates).isoformat() if deletion_dates else None
+    for row in session.exec(retention_query):
+        total_data_entries += 1
+        expires_at = row.retention_expires_at
+        if expires_at and (next_deletion is None or expires_at < next_deletion):
+            next_deletion = expires_at
+
+        if row.data_name is not None:
+            # First record seen for each category is the one reported
+            retention_summary.setdefault(
+                row.data_name,
+                {
+                    "data_type": row.data_type,
+                    "retention_days": row.retention_days,
+                    "deletion_date": expires_at.isoformat() if expires_at else None,
+                    "storage_location": row.storage_location,
+                    "purpose": row.purpose_of_processing,
+                },
+            )
 
     # Count active access grants
-    access_count = len(
-        session.exec(
-            select(EmployeeDataAccess).where(EmployeeDataAccess.is_active.is_(True))
-        ).all()
-    )
+    access_count = session.exec(
+        select(func.count())
+        .select_from(EmployeeDataAccess)
+        .where(EmployeeDataAccess.is_active.is_(True))
+    ).one()
 
     result = {
         "employee_id": employee_id,
         "data_summary": {
-            "total_data_entries": len(retention_records),
-            "data_categories": list(set(inv.data_type for inv in all_inventory)),
+            "total_data_entries": total_data_entries,
+            "data_categories": data_type_categories,
             "retention_policies": retention_summary,
-            "next_scheduled_deletion": next_deletion,
+            "next_scheduled_deletion": (
+                next_deletion.isoformat() if next_deletion else None
+            ),
         },
         "access_information": {
             "employees_with_access_to_your_data": access_count,
@@ -356,7 +457,7 @@ async def get_employee_data_about_me(
             "article_20_data_portability": "Request data export via HR",
         },
         "gdpr_article": "Article 15 - Right of Access",
-        "report_generated_at": datetime.utcnow().isoformat(),
+        "report_generated_at": _utc_now().isoformat(),
     }
 
     # Cache the result
@@ -377,7 +478,7 @@ async def get_employee_data_about_me(
 
 
 @router.get("/employee/{employee_id}/access-controls", response_model=dict)
-async def get_employee_access_controls(
+def get_employee_access_controls(
     employee_id: str,
     session: SessionDep,
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
@@ -421,33 +522,47 @@ async def get_employee_access_controls(
         logger.debug(f"Returning cached access controls for employee {employee_id}")
         return {"employee_id": employee_id, "access_controls": cached_result}
 
-    # Query access controls
-    access_query = select(EmployeeDataAccess).where(
-        EmployeeDataAccess.employee_id == employee_id,
-        EmployeeDataAccess.is_active.is_(True),
+    # Query only the access control columns used in the response
+    access_query = (
+        select(
+            EmployeeDataAccess.id,
+            EmployeeDataAccess.data_inventory_id,
+            DataInventory.data_name,
+            DataInventory.data_type,
+            EmployeeDataAccess.access_level,
+            EmployeeDataAccess.access_reason,
+            EmployeeDataAccess.role_based,
+            EmployeeDataAccess.role_name,
+            EmployeeDataAccess.granted_by,
+            EmployeeDataAccess.granted_at,
+            EmployeeDataAccess.expires_at,
+        )
+        .outerjoin(
+            DataInventory, EmployeeDataAccess.data_inventory_id == DataInventory.id
+        )
+        .where(
+            EmployeeDataAccess.employee_id == employee_id,
+            EmployeeDataAccess.is_active.is_(True),
+        )
     )
-    access_records = session.exec(access_query).all()
 
     access_list = []
-    for record in access_records:
-        inventory = session.get(DataInventory, record.data_inventory_id)
+    for row in session.exec(access_query):
+        # Inventory columns are all NULL when the outer join found no entry
+        has_inventory = row.data_name is not None
         access_list.append(
             {
-                "id": record.id,
-                "data_inventory_id": record.data_inventory_id,
-                "data_name": inventory.data_name if inventory else "Unknown",
-                "data_type": inventory.data_type if inventory else "Unknown",
-                "access_level": record.access_level,
-                "access_reason": record.access_reason,
-                "role_based": record.role_based,
-                "role_name": record.role_name,
-                "granted_by": record.granted_by,
-                "granted_at": (
-                    record.granted_at.isoformat() if record.granted_at else None
-                ),
-                "expires_at": (
-                    record.expires_at.isoformat() if record.expires_at else None
-                ),
+                "id": row.id,
+                "data_inventory_id": row.data_inventory_id,
+                "data_name": row.data_name if has_inventory else "Unknown",
+                "data_type": row.data_type if has_inventory else "Unknown",
+                "access_level": row.access_level,
+                "access_reason": row.access_reason,
+                "role_based": row.role_based,
+                "role_name": row.role_name,
+                "granted_by": row.granted_by,
+                "granted_at": row.granted_at.isoformat() if row.granted_at else None,
+                "expires_at": row.expires_at.isoformat() if row.expires_at else None,
             }
         )
 
@@ -468,24 +583,273 @@ async def get_employee_access_controls(
         "role_based_accesses": sum(1 for a in access_list if a["role_based"]),
         "direct_accesses": sum(1 for a in access_list if not a["role_based"]),
         "access_controls": access_list,
-        "report_generated_at": datetime.utcnow().isoformat(),
+        "report_generated_at": _utc_now().isoformat(),
     }
 
 
 # ========== Data Retention Report Endpoint ==========
 
 
-@router.get("/data-retention-report", response_model=dict)
-async def get_data_retention_report(
+def _retention_status_bucket(now: datetime, threshold_date: datetime):
+    """SQL expression that categorizes retention records into status buckets."""
+    return case(
+        (DataRetention.deletion_completed_at.isnot(None), "deleted"),
+        (
+            or_(
+                DataRetention.retention_status == "expired",
+                DataRetention.retention_expires_at < now,
+            ),
+            "expired",
+        ),
+        (DataRetention.retention_expires_at <= threshold_date, "expiring_soon"),
+        else_="active",
+    ).label("status_bucket")
+
+
+def _retention_status_filter(status: str, now: datetime, threshold_date: datetime):
+    """
+    Index-friendly predicate matching records in one status bucket.
+
+    Equivalent to comparing the status bucket CASE expression, but written
+    as plain range conditions on deletion_completed_at and
+    retention_expires_at so the database can seek the retention index.
+    Assumes threshold_date is not before now, which the endpoint's
+    days_threshold >= 0 guarantees.
+    """
+    if status == "deleted":
+        return DataRetention.deletion_completed_at.isnot(None)
+
+    pending = DataRetention.deletion_completed_at.is_(None)
+    if status == "expired":
+        return and_(
+            pending,
+            or_(
+                DataRetention.retention_expires_at < now,
+                DataRetention.retention_status == "expired",
+            ),
+        )
+
+    not_marked_expired = DataRetention.retention_status != "expired"
+    if status == "expiring_soon":
+        return and_(
+            pending,
+            DataRetention.retention_expires_at >= now,
+            DataRetention.retention_expires_at <= threshold_date,
+            not_marked_expired,
+        )
+    return and_(
+        pending,
+        DataRetention.retention_expires_at > threshold_date,
+        not_marked_expired,
+    )
+
+
+def _build_retention_summary(
+    session: Session,
+    status_bucket,
+    days_threshold: int,
+    now: datetime,
+) -> dict:
+    """Aggregate retention record counts per status bucket and data category."""
+    # Build summary by category, and the marked-for-deletion total, with a
+    # single GROUP BY. Outer joined so records whose inventory row is gone
+    # still count toward the totals, under UNKNOWN_CATEGORY.
+    category = func.coalesce(DataInventory.data_type, UNKNOWN_CATEGORY)
+    summary_query = (
+        select(
+            category,
+            status_bucket,
+            func.count(),
+            # COUNT over CASE without ELSE: integer result on every backend
+            func.count(case((DataRetention.marked_for_deletion.is_(True), 1))),
+        )
+        .select_from(DataRetention)
+        .outerjoin(DataInventory, DataRetention.data_inventory_id == DataInventory.id)
+        .group_by(category, status_bucket)
+    )
+
+    summary_by_category = defaultdict(
+        lambda: dict.fromkeys(("total", *RETENTION_STATUS_BUCKETS), 0)
+    )
+    bucket_totals = dict.fromkeys(RETENTION_STATUS_BUCKETS, 0)
+    marked_for_deletion = 0
+    for category, bucket, count, marked in session.exec(summary_query).all():
+        category_summary = summary_by_category[category]
+        category_summary["total"] += count
+        category_summary[bucket] += count
+        bucket_totals[bucket] += count
+        marked_for_deletion += marked
+
+    return {
+        "total_records_tracked": sum(bucket_totals.values()),
+        "active_records": bucket_totals["active"],
+        "expiring_soon": bucket_totals["expiring_soon"],
+        "expired_records": bucket_totals["expired"],
+        "deleted_records": bucket_totals["deleted"],
+        "marked_for_deletion": marked_for_deletion,
+        "action_items": {
+            "delete_immediately": bucket_totals["expired"],
+            "delete_within_days": bucket_totals["expiring_soon"],
+            "urgent_action_required": bucket_totals["expired"] > 0,
+        },
+        "summary_by_category": dict(summary_by_category),
+        "gdpr_article": "Article 5 - Storage Limitation",
+        "report_generated_at": now.isoformat(),
+        "threshold_days": days_threshold,
+    }
+
+
+def _iter_retention_items(
+    session: Session,
+    now: datetime,
+    threshold_date: datetime,
+    status: str | None,
+    cursor_id: int | None,
+    limit: int | None,
+) -> Iterator[dict]:
+    """
+    Yield retention report items in ID order, streaming rows from the DB.
+
+    ID order (rather than grouped by status bucket, as the report used to
+    be) is what makes cursor_id pagination possible. Records without an
+    inventory row are included with a null data_name and category.
+    """
+    # Fetch only the items matching the requested status
+    items_query = (
+        select(
+            DataRetention.id,
+            DataRetention.record_id,
+            DataRetention.data_created_at,
+            DataRetention.retention_expires_at,
+            DataRetention.data_subject_id,
+            DataRetention.retention_status,
+            DataRetention.marked_for_deletion,
+            DataInventory.data_name,
+            DataInventory.data_type,
+        )
+        .outerjoin(DataInventory, DataRetention.data_inventory_id == DataInventory.id)
+        .order_by(DataRetention.id.asc())
+        .execution_options(yield_per=RETENTION_STREAM_BATCH_SIZE)
+    )
+    if status in RETENTION_STATUS_BUCKETS:
+        items_query = items_query.where(
+            _retention_status_filter(status, now, threshold_date)
+        )
+    if cursor_id is not None:
+        items_query = items_query.where(DataRetention.id > cursor_id)
+    if limit is not None:
+        items_query = items_query.limit(limit)
+
+    # Datetimes are left as-is, orjson encodes them natively to ISO 8601
+    for row in session.exec(items_query):
+        # Calculate age
+        data_age_days = (now - row.data_created_at).days
+        days_until_deletion = (row.retention_expires_at - now).days
+
+        yield {
+            "id": row.id,
+            "data_name": row.data_name,
+            "record_id": row.record_id,
+            "data_created_at": row.data_created_at,
+            "retention_expires_at": row.retention_expires_at,
+            "days_until_deletion": days_until_deletion,
+            "data_age_days": data_age_days,
+            "category": row.data_type,
+            "data_subject": row.data_subject_id,
+            "status": row.retention_status,
+            "marked_for_deletion": row.marked_for_deletion,
+        }
+
+
+def _build_retention_report(
+    session: Session,
+    actor_id: str,
+    role: str,
+    status: str | None,
+    days_threshold: int,
+    cursor_id: int | None,
+    limit: int | None,
+) -> dict:
+    """Query retention records and build the report payload visible to a role."""
+    # Single timestamp for bucketing and the report so they stay consistent
+    now = _utc_now()
+    threshold_date = now + timedelta(days=days_threshold)
+    status_bucket = _retention_status_bucket(now, threshold_date)
+
+    report = _build_retention_summary(session, status_bucket, days_threshold, now)
+    all_items = list(
+        _iter_retention_items(session, now, threshold_date, status, cursor_id, limit)
+    )
+    report["retention_items"] = filter_retention_report_for_role(
+        all_items, actor_id=actor_id, role=role
+    )
+    report["next_cursor"] = all_items[-1]["id"] if all_items else None
+    return report
+
+
+def _stream_retention_report(
+    actor_id: str,
+    role: str,
+    status: str | None,
+    days_threshold: int,
+    cursor_id: int | None,
+    limit: int | None,
+) -> Iterator[bytes]:
+    """Yield the retention report as NDJSON: the summary, then one item per line."""
+    now = _utc_now()
+    threshold_date = now + timedelta(days=days_threshold)
+    status_bucket = _retention_status_bucket(now, threshold_date)
+
+    # Own session, the request-scoped one may close before streaming finishes
+    with Session(engine) as session:
+        summary = _build_retention_summary(session, status_bucket, days_threshold, now)
+        yield orjson.dumps(summary) + b"\n"
+
+        items = _iter_retention_items(
+            session, now, threshold_date, status, cursor_id, limit
+        )
+        for batch in batched(items, RETENTION_STREAM_BATCH_SIZE):
+            for item in filter_retention_report_for_role(
+                list(batch), actor_id=actor_id, role=role
+            ):
+                yield orjson.dumps(item) + b"\n"
+
+
+def _refresh_retention_report(
+    actor_id: str, role: str, revision: bytes, **filters
+) -> None:
+    """Rebuild a cached retention report in the background."""
+    with Session(engine) as session:
+        result = _build_retention_report(session, actor_id, role, **filters)
+    get_cache_service().set_retention_report(
+        result=result, revision=revision, role=role, **filters
+    )
+
+
+@router.get("/data-retention-report", response_model=None)
+def get_data_retention_report(
     session: SessionDep,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
     status: str | None = Query(
         None, description="Filter by status: active, expiring_soon, expired, deleted"
     ),
     days_threshold: int = Query(
-        30, description="Days threshold for 'expiring_soon' status"
+        30, ge=0, description="Days threshold for 'expiring_soon' status"
     ),
-) -> dict:
+    cursor_id: int | None = Query(
+        None, description="Return items with an ID greater than this cursor"
+    ),
+    limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+    response_format: Literal["json", "ndjson"] = Query(
+        "json",
+        alias="format",
+        description="ndjson streams the summary, then one retention item per line",
+    ),
+    summary_only: bool = Query(
+        False, description="Return only the summary counts, without retention items"
+    ),
+) -> Response | dict:
     """
     Get data age and what needs to be deleted.
     GDPR Article 5 - Storage Limitation (Kept no longer than necessary).
@@ -497,12 +861,18 @@ async def get_data_retention_report(
     - Recently deleted records
     - Action items (what needs to be deleted soon)
 
+    Items are listed in record ID order, whatever their status.
+
     **Authentication Required**: Bearer token
     **Required Role**: HR_Admin or HR_Manager
 
     Query Parameters:
     - status: Filter by retention status (active, expiring_soon, expired, deleted)
     - days_threshold: Days until expiration to mark as 'expiring_soon' (default: 30)
+    - cursor_id: Keyset cursor - pass the previous page's next_cursor
+    - limit: Maximum retention items to return (default: all, max: 1000)
+    - format: json (default) or ndjson to stream large reports without caching
+    - summary_only: Return only the counts (status, cursor_id, limit are ignored)
 
     Returns:
     - Comprehensive retention report
@@ -530,21 +900,71 @@ async def get_data_retention_report(
         f"Data retention report requested by user {current_user.sub} with status filter: {status}"
     )
 
+    if summary_only:
+        # Aggregates only, cheap enough to compute without the cache
+        now = _utc_now()
+        status_bucket = _retention_status_bucket(
+            now, now + timedelta(days=days_threshold)
+        )
+        summary = _build_retention_summary(session, status_bucket, days_threshold, now)
+        log_compliance_access(
+            actor_id=current_user.sub,
+            actor_role=user_role,
+            action="view_retention_report",
+            target="all",
+            allowed=True,
+        )
+        return summary
+
+    if response_format == "ndjson":
+        # Streamed straight from the DB, bypassing the cache
+        log_compliance_access(
+            actor_id=current_user.sub,
+            actor_role=user_role,
+            action="view_retention_report",
+            target="all",
+            allowed=True,
+        )
+        return StreamingResponse(
+            _stream_retention_report(
+                current_user.sub,
+                user_role,
+                status=status,
+                days_threshold=days_threshold,
+                cursor_id=cursor_id,
+                limit=limit,
+            ),
+            media_type="application/x-ndjson",
+        )
+
     # Try to get from cache first
     cache = get_cache_service()
-    cached_result = cache.get_retention_report(
+    # Cache entries are stored per role, already filtered for that role. Only
+    # HR roles reach this endpoint, and the retention filter does not depend
+    # on the actor for them, so the entry can be shared across HR users.
+    cached_result, revision = cache.get_retention_report(
         status=status,
         days_threshold=days_threshold,
+        cursor_id=cursor_id,
+        limit=limit,
+        role=user_role,
     )
 
     if cached_result:
         logger.debug("Returning cached retention report")
-        # Apply role-based filtering
-        if "retention_items" in cached_result:
-            cached_result["retention_items"] = filter_retention_report_for_role(
-                cached_result["retention_items"],
-                actor_id=current_user.sub,
-                role=user_role,
+        cache_key = cache.retention_report_key(
+            status, days_threshold, cursor_id, limit, user_role
+        )
+        if cache.needs_refresh(cache_key):
+            background_tasks.add_task(
+                _refresh_retention_report,
+                current_user.sub,
+                user_role,
+                revision,
+                status=status,
+                days_threshold=days_threshold,
+                cursor_id=cursor_id,
+                limit=limit,
             )
         log_compliance_access(
             actor_id=current_user.sub,
@@ -553,120 +973,28 @@ async def get_data_retention_report(
             target="all",
             allowed=True,
         )
-        return cached_result
-
-    # Get all retention records
-    query = select(DataRetention)
-    retention_records = session.exec(query).all()
-
-    # Process retention records
-    active_records = []
-    expiring_soon = []
-    expired_records = []
-    deleted_records = []
-
-    now = datetime.utcnow()
-    threshold_date = now + timedelta(days=days_threshold)
-
-    for record in retention_records:
-        inventory = session.get(DataInventory, record.data_inventory_id)
-        if not inventory:
-            continue
+        # Already serialized at cache time, send it as-is
+        return Response(content=cached_result, media_type="application/json")
 
-        # Calculate age
-        data_age_days = (now - record.data_created_at).days
-        days_until_deletion = (record.retention_expires_at - now).days
-
-        item = {
-            "id": record.id,
-            "data_name": inventory.data_name,
-            "record_id": record.record_id,
-            "data_created_at": record.data_created_at.isoformat(),
-            "retention_expires_at": record.retention_expires_at.isoformat(),
-            "days_until_deletion": days_until_deletion,
-            "data_age_days": data_age_days,
-            "category": inventory.data_type,
-            "data_subject": record.data_subject_id,
-            "status": record.retention_status,
-            "marked_for_deletion": record.marked_for_deletion,
-        }
-
-        # Categorize
-        if record.deletion_completed_at:
-            deleted_records.append(item)
-        elif record.retention_status == "expired" or now > record.retention_expires_at:
-            expired_records.append(item)
-        elif record.retention_expires_at <= threshold_date:
-            expiring_soon.append(item)
-        else:
-            active_records.append(item)
-
-    # Apply status filter if specified
-    all_items = active_records + expiring_soon + expired_records + deleted_records
-    if status:
-        if status == "active":
-            all_items = active_records
-        elif status == "expiring_soon":
-            all_items = expiring_soon
-        elif status == "expired":
-            all_items = expired_records
-        elif status == "deleted":
-            all_items = deleted_records
-
-    # Build summary by category
-    summary_by_category = {}
-    for item in active_records + expiring_soon + expired_records + deleted_records:
-        cat = item["category"]
-        if cat not in summary_by_category:
-            summary_by_category[cat] = {
-                "total": 0,
-                "active": 0,
-                "expiring_soon": 0,
-                "expired": 0,
-                "deleted": 0,
-            }
-        summary_by_category[cat]["total"] += 1
-        if item in active_records:
-            summary_by_category[cat]["active"] += 1
-        elif item in expiring_soon:
-            summary_by_category[cat]["expiring_soon"] += 1
-        elif item in expired_records:
-            summary_by_category[cat]["expired"] += 1
-        elif item in deleted_records:
-            summary_by_category[cat]["deleted"] += 1
-
-    result = {
-        "total_records_tracked": len(retention_records),
-        "active_records": len(active_records),
-        "expiring_soon": len(expiring_soon),
-        "expired_records": len(expired_records),
-        "deleted_records": len(deleted_records),
-        "marked_for_deletion": sum(
-            1 for r in retention_records if r.marked_for_deletion
-        ),
-        "action_items": {
-            "delete_immediately": len(expired_records),
-            "delete_within_days": len(expiring_soon),
-            "urgent_action_required": len(expired_records) > 0,
-        },
-        "retention_items": all_items,
-        "summary_by_category": summary_by_category,
-        "gdpr_article": "Article 5 - Storage Limitation",
-        "report_generated_at": datetime.utcnow().isoformat(),
-        "threshold_days": days_threshold,
-    }
-
-    # Cache the result
-    cache.set_retention_report(
-        result=result,
+    result = _build_retention_report(
+        session,
+        current_user.sub,
+        user_role,
         status=status,
         days_threshold=days_threshold,
+        cursor_id=cursor_id,
+        limit=limit,
     )
 
-    # Apply role-based filtering
-    result["retention_items"] = filter_retention_report_for_role(
-        result["retention_items"],
-        actor_id=current_user.sub,
+    # Serialize once for both the cache entry and the response
+    payload = cache.serialize(result)
+    cache.set_retention_report(
+        result=payload,
+        revision=revision,
+        status=status,
+        days_threshold=days_threshold,
+        cursor_id=cursor_id,
+        limit=limit,
         role=user_role,
     )
 
@@ -678,15 +1006,40 @@ async def get_data_retention_report(
         allowed=True,
     )
 
-    return result
+    return Response(content=payload, media_type="application/json")
 
 
 # ========== Data Categories Endpoint ==========
 
 
+def _build_data_categories(session: Session) -> list[dict]:
+    """Query all data categories for the categories listing."""
+    # Query categories
+    categories = session.exec(
+        select(
+            DataCategory.id,
+            DataCategory.name,
+            DataCategory.description,
+            DataCategory.sensitivity_level,
+            DataCategory.created_at,
+        )
+    ).all()
+
+    # created_at is encoded to ISO 8601 when the response is serialized
+    return [cat._asdict() for cat in categories]
+
+
+def _refresh_data_categories() -> None:
+    """Rebuild the cached data categories listing in the background."""
+    with Session(engine) as session:
+        categories_list = _build_data_categories(session)
+    get_cache_service().set_data_categories(categories_list)
+
+
 @router.get("/data-categories", response_model=dict)
-async def get_data_categories(
+def get_data_categories(
     session: SessionDep,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
 ) -> dict:
     """
@@ -711,24 +1064,14 @@ async def get_data_categories(
     cached_categories = cache.get_data_categories()
 
     if cached_categories:
+        if cache.needs_refresh(CATEGORIES_CACHE_KEY):
+            background_tasks.add_task(_refresh_data_categories)
         return {
             "categories": cached_categories,
             "count": len(cached_categories),
         }
 
-    # Query categories
-    categories = session.exec(select(DataCategory)).all()
-
-    categories_list = [
-        {
-            "id": cat.id,
-            "name": cat.name,
-            "description": cat.description,
-            "sensitivity_level": cat.sensitivity_level,
-            "created_at": cat.created_at.isoformat() if cat.created_at else None,
-        }
-        for cat in categories
-    ]
+    categories_list = _build_data_categories(session)
 
     # Cache the result
     cache.set_data_categories(categories_list)
@@ -736,5 +1079,35 @@ async def get_data_categories(
     return {
         "categories": categories_list,
         "count": len(categories_list),
-        "report_generated_at": datetime.utcnow().isoformat(),
+        "report_generated_at": _utc_now().isoformat(),
+    }
+
+
+@router.post("/data-categories/refresh", response_model=dict)
+def refresh_data_categories(
+    current_user: Annotated[TokenData, Depends(get_current_active_user)],
+) -> dict:
+    """
+    Reload data category reference data after categories are changed.
+
+    **Authentication Required**: Bearer token
+    **Required Role**: HR_Admin
+
+    Returns:
+    - Number of categories loaded
+    """
+    user_role = _get_user_role(current_user)
+
+    if not can_access_full_compliance_data(user_role):
+        raise HTTPException(
+            status_code=403,
+            detail="You do not have permission to refresh data categories. Required role: HR_Admin.",
+        )
+
+    categories = refresh_category_cache()
+    get_cache_service().invalidate_categories_cache()
+
+    return {
+        "count": len(categories),
+        "refreshed_at": _utc_now().isoformat(),
     }
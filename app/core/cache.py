@@ -9,17 +9,150 @@ Provides caching for:
 - Event deduplication
 """
 
-import json
-from datetime import datetime, timedelta
-from typing import Any, Optional
-
+import hashlib
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import batched
+from typing import Any, Iterator, Optional
+
+import orjson
 import redis
+from redis.backoff import ExponentialBackoff
+from redis.commands.core import Script
+from redis.retry import Retry
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+CATEGORIES_CACHE_KEY = "compliance:categories"
+DATA_TYPES_CACHE_KEY = "compliance:data_types"
+
+# Daily counters are kept for a week
+DAILY_COUNTER_TTL_SECONDS = 86400 * 7
+
+# (UTC day number, "YYYY-MM-DD") of the last formatted day
+_today_cache: tuple[int, str] = (-1, "")
+
+# Keys removed per UNLINK call on bulk invalidation
+UNLINK_BATCH_SIZE = 500
+
+# One-byte markers prefixed to indexed payloads
+_RAW_PAYLOAD = b"\x00"
+_ZLIB_PAYLOAD = b"\x01"
+
+# Joined key parts longer than this are replaced by a fixed-size digest
+MAX_KEY_PARTS_LENGTH = 64
+
+# EXPIRE's NX/GT flags need Redis 7, so conditional expiry is done in Lua,
+# which is still one atomic round-trip on any supported server.
+# Increments a counter, setting its TTL only when it has none yet
+_INCR_WITH_TTL_SCRIPT = """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return value
+"""
+# Sets a key's TTL if it has none or would expire sooner, never shortening it
+_EXTEND_TTL_SCRIPT = """
+local ttl = redis.call('TTL', KEYS[1])
+if ttl == -1 or (ttl >= 0 and ttl < tonumber(ARGV[1])) then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+"""
+
+
+def _today_str() -> str:
+    """Today's UTC date as YYYY-MM-DD, formatted only once per day."""
+    global _today_cache
+    now = time.time()
+    day = int(now // 86400)
+    cached_day, today = _today_cache
+    if cached_day != day:
+        today = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d")
+        _today_cache = (day, today)
+    return today
+
+
+def _make_key(prefix: str, *parts: Any) -> str:
+    """
+    Build a cache key from its parts, hashing them if they would make it long.
+
+    Keys stay readable for the common short filters, while free-text filters
+    such as data_type cannot blow up key size in Redis.
+    """
+    joined = ":".join(str(part) for part in parts)
+    if len(joined) > MAX_KEY_PARTS_LENGTH:
+        joined = hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+    return f"{prefix}:{joined}"
+
+
+def _pack_payload(payload: bytes) -> bytes:
+    """Compress payloads above CACHE_COMPRESS_MIN_SIZE, tagging either way."""
+    if len(payload) < settings.CACHE_COMPRESS_MIN_SIZE:
+        return _RAW_PAYLOAD + payload
+    return _ZLIB_PAYLOAD + zlib.compress(payload, settings.CACHE_COMPRESS_LEVEL)
+
+
+def _unpack_payload(data: bytes) -> bytes:
+    """Reverse _pack_payload; untagged entries are returned unchanged."""
+    marker = data[:1]
+    if marker == _ZLIB_PAYLOAD:
+        return zlib.decompress(data[1:])
+    if marker == _RAW_PAYLOAD:
+        return data[1:]
+    return data
+
+
+class LocalTTLCache:
+    """
+    Small thread-safe in-process cache with per-entry TTL and LRU eviction.
+
+    Sits in front of Redis for hot read-mostly keys so repeated reads within
+    a worker skip the Redis round-trip and JSON decode. Invalidations only
+    reach the local process, so it is limited to keys where other workers
+    serving a short-lived stale copy is harmless (the category list), never
+    to per-employee data or access controls.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: int):
+        self._maxsize = maxsize
+        self._ttl_ns = ttl_seconds * 1_000_000_000
+        self._entries: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Get a live entry, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic_ns():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic_ns() + self._ttl_ns, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
 
 class ComplianceCacheService:
     """
@@ -28,8 +161,23 @@ class ComplianceCacheService:
     """
 
     def __init__(self):
+        self._pool: Optional[redis.ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
         self._connected = False
+        # Registered on connect; see _INCR_WITH_TTL_SCRIPT / _EXTEND_TTL_SCRIPT
+        self._incr_with_ttl: Optional[Script] = None
+        self._extend_ttl: Optional[Script] = None
+        self._local = LocalTTLCache(
+            settings.LOCAL_CACHE_MAX_ENTRIES, settings.LOCAL_CACHE_TTL_SECONDS
+        )
+        # Writes held back while a deferred_writes() block runs
+        self._deferred_lock = threading.Lock()
+        self._defer_depth = 0
+        self._pending_revisions: set[str] = set()
+        self._pending_deletes: set[str] = set()
+        self._pending_counters: dict[tuple[str, Optional[int]], int] = {}
+        # Last PING outcome, reused by health checks for HEALTH_PING_CACHE_SECONDS
+        self._ping_result: tuple[int, bool] = (0, False)
 
     def connect(self) -> bool:
         """
@@ -41,22 +189,47 @@ class ComplianceCacheService:
         if self._client is not None and self._connected:
             return True
 
+        # Server-assisted client-side caching: GETs are answered from local
+        # memory until Redis pushes an invalidation for the key (RESP3 only)
+        client_cache: dict[str, Any] = {}
+        if settings.REDIS_CLIENT_CACHE_MAX_SIZE > 0:
+            # Imported here: redis.cache only exists from redis-py 5.1
+            from redis.cache import CacheConfig
+
+            client_cache = {
+                "protocol": 3,
+                "cache_config": CacheConfig(
+                    max_size=settings.REDIS_CLIENT_CACHE_MAX_SIZE
+                ),
+            }
+
         try:
-            self._client = redis.Redis(
+            # One shared pool for API threads and the Kafka consumer thread.
+            # Responses stay as bytes so cached JSON is served undecoded.
+            self._pool = redis.ConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD or None,
-                decode_responses=True,
+                max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
                 socket_timeout=5,
                 socket_connect_timeout=5,
+                # Reconnect and retry once when a command hits a dropped
+                # connection, instead of pinging before every command
+                retry=Retry(ExponentialBackoff(), 1),
+                retry_on_error=[redis.ConnectionError, redis.TimeoutError],
+                **client_cache,
             )
+            self._client = redis.Redis(connection_pool=self._pool)
+            self._incr_with_ttl = self._client.register_script(_INCR_WITH_TTL_SCRIPT)
+            self._extend_ttl = self._client.register_script(_EXTEND_TTL_SCRIPT)
             # Test connection
             self._client.ping()
             self._connected = True
             logger.info(
                 f"Connected to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}"
             )
+            self._apply_server_config()
             return True
         except redis.ConnectionError as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -67,122 +240,449 @@ class ComplianceCacheService:
             self._connected = False
             return False
 
+    def _apply_server_config(self) -> None:
+        """
+        Apply the configured eviction and defragmentation settings to Redis.
+
+        Only settings that are explicitly configured are sent. Managed Redis
+        offerings often disable CONFIG, so failures are logged and ignored.
+        """
+        server_config = {}
+        if settings.REDIS_MAXMEMORY_POLICY:
+            server_config["maxmemory-policy"] = settings.REDIS_MAXMEMORY_POLICY
+        if settings.REDIS_ACTIVEDEFRAG is not None:
+            server_config["activedefrag"] = (
+                "yes" if settings.REDIS_ACTIVEDEFRAG else "no"
+            )
+
+        for name, value in server_config.items():
+            try:
+                self._client.config_set(name, value)
+                logger.info(f"Set Redis {name} to {value}")
+            except redis.ResponseError as e:
+                logger.warning(f"Could not set Redis {name}: {e}")
+
     def disconnect(self) -> None:
         """Close Redis connection."""
-        if self._client is not None:
+        if self._pool is not None:
             try:
-                self._client.close()
+                self._pool.disconnect()
                 self._connected = False
                 logger.info("Redis connection closed")
             except Exception as e:
                 logger.error(f"Error closing Redis connection: {e}")
 
     def is_connected(self) -> bool:
-        """Check if Redis is connected."""
-        if not self._connected or self._client is None:
+        """Check if Redis was connected, without a round-trip."""
+        return self._connected and self._client is not None
+
+    def ping(self) -> bool:
+        """
+        Check that Redis is reachable (used by health checks).
+
+        The outcome is reused for HEALTH_PING_CACHE_SECONDS so frequent
+        probes don't each cost a round-trip.
+        """
+        if not self.is_connected():
             return False
+        now = time.monotonic_ns()
+        checked_at, reachable = self._ping_result
+        if now - checked_at < settings.HEALTH_PING_CACHE_SECONDS * 1_000_000_000:
+            return reachable
         try:
-            self._client.ping()
-            return True
+            reachable = bool(self._client.ping())
         except Exception:
-            self._connected = False
-            return False
+            reachable = False
+        self._ping_result = (now, reachable)
+        return reachable
 
     def _ensure_connected(self) -> bool:
-        """Ensure Redis connection is active."""
+        """
+        Ensure a Redis client is available.
+
+        Only connects when there is no client yet. Dropped connections are
+        re-established by the client's retry policy when a command fails.
+        """
         if not self.is_connected():
             return self.connect()
         return True
 
+    @staticmethod
+    def _index_key(bucket: str) -> str:
+        """Build the key of the set indexing every cached key of a bucket."""
+        return f"compliance:index:{bucket}"
+
+    def _set_indexed(
+        self, bucket: str, cache_key: str, ttl: int, payload: bytes
+    ) -> None:
+        """
+        Cache a payload and record its key in the bucket index in one round-trip.
+
+        Large payloads are stored compressed. The index never expires before
+        the longest-lived entry it lists.
+        """
+        index_key = self._index_key(bucket)
+        with self._client.pipeline(transaction=False) as pipe:
+            pipe.setex(cache_key, ttl, _pack_payload(payload))
+            pipe.sadd(index_key, cache_key)
+            self._extend_ttl(keys=[index_key], args=[ttl], client=pipe)
+            pipe.execute()
+
+    def _get_indexed(self, bucket: str, cache_key: str) -> Optional[bytes]:
+        """Read a cached payload, pruning its expired key from the bucket index."""
+        data = self._client.get(cache_key)
+        if data is None:
+            self._client.srem(self._index_key(bucket), cache_key)
+            return None
+        return _unpack_payload(data)
+
+    def _invalidate_index(self, bucket: str) -> int:
+        """
+        Delete every cached key listed in a bucket index, and the index itself.
+
+        Replaces keyspace scans: the index is read and dropped atomically, so
+        entries cached during invalidation land in a fresh index.
+
+        Returns:
+            Number of keys deleted
+        """
+        index_key = self._index_key(bucket)
+        with self._client.pipeline() as pipe:
+            pipe.smembers(index_key)
+            pipe.unlink(index_key)
+            cache_keys, _ = pipe.execute()
+
+        deleted = 0
+        for chunk in batched(cache_keys, UNLINK_BATCH_SIZE):
+            deleted += self._client.unlink(*chunk)
+        return deleted
+
+    # ==========================================
+    # Generational Revisions
+    # ==========================================
+
+    @staticmethod
+    def _revision_key(namespace: str) -> str:
+        """Build the key of a namespace's revision counter."""
+        return f"compliance:rev:{namespace}"
+
+    def _get_versioned(
+        self, namespace: str, cache_key: str
+    ) -> tuple[bytes, Optional[bytes]]:
+        """
+        Read a cached payload, treating it as a miss if its revision is stale.
+
+        The revision and the entry are fetched in one round-trip. Entries are
+        never trusted while the revision counter is missing, so a counter
+        lost to eviction cannot revive entries from an older generation.
+
+        Returns:
+            The current revision, to stamp a rebuilt entry with, and the
+            payload or None on a miss
+        """
+        revision_key = self._revision_key(namespace)
+        revision, data = self._client.mget(revision_key, cache_key)
+        if revision is None:
+            # Start a fresh generation before the caller loads its data, so
+            # a bump made meanwhile still moves past it
+            with self._client.pipeline(transaction=False) as pipe:
+                pipe.set(revision_key, time.time_ns(), nx=True)
+                pipe.get(revision_key)
+                _, revision = pipe.execute()
+            return revision, None
+        if data is None:
+            return revision, None
+
+        stamp, sep, payload = data.partition(b"|")
+        if not sep or stamp != revision:
+            return revision, None
+        return revision, _unpack_payload(payload)
+
+    def _set_versioned(
+        self, cache_key: str, ttl: int, payload: bytes, revision: bytes
+    ) -> None:
+        """
+        Cache a payload stamped with the revision read before it was loaded.
+
+        A bump that lands in between leaves the new entry already stale.
+        """
+        self._client.setex(cache_key, ttl, revision + b"|" + _pack_payload(payload))
+
+    def bump_revision(self, *namespaces: str) -> None:
+        """
+        Invalidate every cached entry of one or more namespaces.
+
+        Replaces deleting the entries: one INCR per namespace makes all of
+        them stale, and they expire on their own TTL. Inside a
+        deferred_writes() block each namespace is bumped once when the
+        block ends.
+
+        Args:
+            namespaces: Namespaces to invalidate, e.g. "inventory", "retention"
+        """
+        with self._deferred_lock:
+            if self._defer_depth:
+                self._pending_revisions.update(namespaces)
+                return
+        self._flush_writes(set(namespaces), set(), {})
+
+    # ==========================================
+    # Deferred Writes
+    # ==========================================
+
+    @contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        """
+        Buffer invalidations and counter increments until the block ends.
+
+        Revision bumps, employee data invalidations and counter increments
+        made inside the block are coalesced and sent in a single pipeline
+        on exit, so a whole batch of events pays one round-trip. Writes from
+        other threads made meanwhile are held back too; in-process caches
+        are still invalidated immediately.
+        """
+        with self._deferred_lock:
+            self._defer_depth += 1
+        try:
+            yield
+        finally:
+            revisions, deletes, counters = set(), set(), {}
+            with self._deferred_lock:
+                self._defer_depth -= 1
+                if not self._defer_depth:
+                    revisions, self._pending_revisions = self._pending_revisions, set()
+                    deletes, self._pending_deletes = self._pending_deletes, set()
+                    counters, self._pending_counters = self._pending_counters, {}
+            self._flush_writes(revisions, deletes, counters)
+
+    def _defer_write(
+        self,
+        delete: Optional[str] = None,
+        counter: Optional[tuple[str, Optional[int]]] = None,
+        amount: int = 0,
+    ) -> bool:
+        """
+        Queue a key deletion or counter increment if writes are deferred.
+
+        Returns:
+            True if it was queued, False if the caller should write it now
+        """
+        with self._deferred_lock:
+            if not self._defer_depth:
+                return False
+            if delete is not None:
+                self._pending_deletes.add(delete)
+            if counter is not None:
+                self._pending_counters[counter] = (
+                    self._pending_counters.get(counter, 0) + amount
+                )
+            return True
+
+    def _flush_writes(
+        self,
+        revisions: set[str],
+        deletes: set[str],
+        counters: dict[tuple[str, Optional[int]], int],
+    ) -> None:
+        """Send revision bumps, deletions and counter increments in one round-trip."""
+        if not (revisions or deletes or counters) or not self._ensure_connected():
+            return
+
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                for namespace in sorted(revisions):
+                    # A missing counter starts from a fresh token, not 1
+                    pipe.set(self._revision_key(namespace), time.time_ns(), nx=True)
+                    pipe.incr(self._revision_key(namespace))
+                if deletes:
+                    pipe.delete(*deletes)
+                for (cache_key, ttl_seconds), amount in counters.items():
+                    if ttl_seconds is None:
+                        pipe.incrby(cache_key, amount)
+                    else:
+                        self._incr_with_ttl(
+                            keys=[cache_key], args=[amount, ttl_seconds], client=pipe
+                        )
+                pipe.execute()
+        except Exception as e:
+            logger.error(f"Error flushing deferred cache writes: {e}")
+
+    @staticmethod
+    def serialize(value: Any) -> bytes:
+        """
+        Encode a value the way every cache entry is stored.
+
+        Callers that store one payload under several keys, or also send it
+        to a client, can encode it once and pass the bytes along.
+        """
+        return orjson.dumps(value, default=str)
+
+    def set_raw(self, cache_key: str, encoded: bytes, ttl_seconds: int) -> bool:
+        """
+        Cache an already serialized payload under a key.
+
+        Args:
+            cache_key: Full cache key
+            encoded: Payload from serialize()
+            ttl_seconds: Cache TTL in seconds
+
+        Returns:
+            True if cached successfully
+        """
+        if not self._ensure_connected():
+            return False
+
+        try:
+            self._client.setex(cache_key, ttl_seconds, encoded)
+            return True
+        except Exception as e:
+            logger.error(f"Error setting cache key {cache_key}: {e}")
+            return False
+
+    # ==========================================
+    # Stale-While-Revalidate
+    # ==========================================
+
+    def needs_refresh(self, cache_key: str) -> bool:
+        """
+        Check whether a cached entry is about to expire and claim its refresh.
+
+        Entries within CACHE_STALE_WINDOW_SECONDS of expiry are still served.
+        The first caller to see such an entry takes a short-lived refresh lock
+        and is expected to rebuild it in the background; everyone else keeps
+        getting the cached copy instead of stampeding the database.
+
+        Args:
+            cache_key: Key of the cache entry that was just served
+
+        Returns:
+            True if the caller should refresh the entry
+        """
+        if not self._ensure_connected():
+            return False
+
+        window = settings.CACHE_STALE_WINDOW_SECONDS
+        try:
+            ttl = self._client.ttl(cache_key)
+            if ttl < 0 or ttl > window:
+                return False
+            return bool(
+                self._client.set(
+                    f"compliance:refresh:{cache_key}", "1", nx=True, ex=window
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error checking cache refresh: {e}")
+            return False
+
     # ==========================================
     # Data Inventory Cache
     # ==========================================
 
+    @staticmethod
+    def data_inventory_key(
+        category_id: Optional[int] = None,
+        data_type: Optional[str] = None,
+        cursor_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        role: Optional[str] = None,
+    ) -> str:
+        """Build the cache key for a data inventory query as seen by a role."""
+        return _make_key(
+            "compliance:inventory", role, category_id, data_type, cursor_id, skip, limit
+        )
+
     def get_data_inventory(
         self,
         category_id: Optional[int] = None,
         data_type: Optional[str] = None,
+        cursor_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> Optional[dict[str, Any]]:
+        role: Optional[str] = None,
+    ) -> tuple[Optional[bytes], Optional[bytes]]:
         """
-        Get cached data inventory query result.
+        Get cached data inventory query result as serialized JSON.
+
+        The payload is returned as stored so it can be sent to the client
+        without decoding and re-encoding it. The revision read alongside it
+        must be passed to set_data_inventory() when the result is rebuilt.
 
         Args:
             category_id: Optional category filter
             data_type: Optional data type filter
-            skip: Pagination offset
+            cursor_id: Keyset pagination cursor
+            skip: Pagination offset (deprecated)
             limit: Pagination limit
+            role: Role the cached result was filtered for
 
         Returns:
-            Cached result or None
+            Cached JSON payload or None, and the revision or None if Redis is
+            unavailable
         """
         if not self._ensure_connected():
-            return None
+            return None, None
 
-        cache_key = f"compliance:inventory:{category_id}:{data_type}:{skip}:{limit}"
+        cache_key = self.data_inventory_key(
+            category_id, data_type, cursor_id, skip, limit, role
+        )
         try:
-            data = self._client.get(cache_key)
-            if data:
-                return json.loads(data)
+            revision, payload = self._get_versioned("inventory", cache_key)
+            return payload, revision
         except Exception as e:
             logger.error(f"Error reading inventory cache: {e}")
-        return None
+        return None, None
 
     def set_data_inventory(
         self,
-        result: dict[str, Any],
+        result: dict[str, Any] | bytes,
+        revision: Optional[bytes],
         category_id: Optional[int] = None,
         data_type: Optional[str] = None,
+        cursor_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        role: Optional[str] = None,
         ttl_seconds: Optional[int] = None,
     ) -> bool:
         """
         Cache data inventory query result.
 
         Args:
-            result: Query result to cache
+            result: Query result to cache, or its serialize() output
+            revision: Revision returned by the get_data_inventory() call made
+                before the result was built
             category_id: Category filter used
             data_type: Data type filter used
-            skip: Pagination offset
+            cursor_id: Keyset pagination cursor
+            skip: Pagination offset (deprecated)
             limit: Pagination limit
+            role: Role the cached result was filtered for
             ttl_seconds: Cache TTL in seconds
 
         Returns:
             True if cached successfully
         """
-        if not self._ensure_connected():
+        if revision is None or not self._ensure_connected():
             return False
 
-        cache_key = f"compliance:inventory:{category_id}:{data_type}:{skip}:{limit}"
+        cache_key = self.data_inventory_key(
+            category_id, data_type, cursor_id, skip, limit, role
+        )
         ttl = ttl_seconds or settings.CACHE_TTL_INVENTORY
         try:
-            self._client.setex(cache_key, ttl, json.dumps(result, default=str))
+            self._set_versioned(
+                cache_key,
+                ttl,
+                result if isinstance(result, bytes) else self.serialize(result),
+                revision,
+            )
             return True
         except Exception as e:
             logger.error(f"Error setting inventory cache: {e}")
             return False
 
-    def invalidate_inventory_cache(self) -> int:
-        """
-        Invalidate all inventory cache entries.
-
-        Returns:
-            Number of keys deleted
-        """
-        if not self._ensure_connected():
-            return 0
-
-        try:
-            keys = self._client.keys("compliance:inventory:*")
-            if keys:
-                return self._client.delete(*keys)
-            return 0
-        except Exception as e:
-            logger.error(f"Error invalidating inventory cache: {e}")
-            return 0
-
     # ==========================================
     # Employee Data About Me Cache
     # ==========================================
@@ -204,7 +704,7 @@ class ComplianceCacheService:
         try:
             data = self._client.get(cache_key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.error(f"Error reading employee data cache: {e}")
         return None
@@ -232,7 +732,7 @@ class ComplianceCacheService:
         cache_key = f"compliance:employee_data:{employee_id}"
         ttl = ttl_seconds or settings.CACHE_TTL_EMPLOYEE_DATA
         try:
-            self._client.setex(cache_key, ttl, json.dumps(result, default=str))
+            self._client.setex(cache_key, ttl, self.serialize(result))
             return True
         except Exception as e:
             logger.error(f"Error setting employee data cache: {e}")
@@ -248,10 +748,12 @@ class ComplianceCacheService:
         Returns:
             True if deleted successfully
         """
+        cache_key = f"compliance:employee_data:{employee_id}"
+        if self._defer_write(delete=cache_key):
+            return True
         if not self._ensure_connected():
             return False
 
-        cache_key = f"compliance:employee_data:{employee_id}"
         try:
             self._client.delete(cache_key)
             return True
@@ -263,83 +765,105 @@ class ComplianceCacheService:
     # Retention Report Cache
     # ==========================================
 
+    @staticmethod
+    def retention_report_key(
+        status: Optional[str] = None,
+        days_threshold: int = 30,
+        cursor_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        role: Optional[str] = None,
+    ) -> str:
+        """Build the cache key for a retention report as seen by a role."""
+        return _make_key(
+            "compliance:retention", role, status, days_threshold, cursor_id, limit
+        )
+
     def get_retention_report(
         self,
         status: Optional[str] = None,
         days_threshold: int = 30,
-    ) -> Optional[dict[str, Any]]:
+        cursor_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        role: Optional[str] = None,
+    ) -> tuple[Optional[bytes], Optional[bytes]]:
         """
-        Get cached retention report.
+        Get cached retention report as serialized JSON.
+
+        The payload is returned as stored so it can be sent to the client
+        without decoding and re-encoding it. The revision read alongside it
+        must be passed to set_retention_report() when the report is rebuilt.
 
         Args:
             status: Optional status filter
             days_threshold: Days threshold for expiring_soon
+            cursor_id: Keyset pagination cursor
+            limit: Pagination limit
+            role: Role the cached result was filtered for
 
         Returns:
-            Cached result or None
+            Cached JSON payload or None, and the revision or None if Redis is
+            unavailable
         """
         if not self._ensure_connected():
-            return None
+            return None, None
 
-        cache_key = f"compliance:retention:{status}:{days_threshold}"
+        cache_key = self.retention_report_key(
+            status, days_threshold, cursor_id, limit, role
+        )
         try:
-            data = self._client.get(cache_key)
-            if data:
-                return json.loads(data)
+            revision, payload = self._get_versioned("retention", cache_key)
+            return payload, revision
         except Exception as e:
             logger.error(f"Error reading retention cache: {e}")
-        return None
+        return None, None
 
     def set_retention_report(
         self,
-        result: dict[str, Any],
+        result: dict[str, Any] | bytes,
+        revision: Optional[bytes],
         status: Optional[str] = None,
         days_threshold: int = 30,
+        cursor_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        role: Optional[str] = None,
         ttl_seconds: Optional[int] = None,
     ) -> bool:
         """
         Cache retention report.
 
         Args:
-            result: Report to cache
+            result: Report to cache, or its serialize() output
+            revision: Revision returned by the get_retention_report() call
+                made before the report was built
             status: Status filter used
             days_threshold: Days threshold used
+            cursor_id: Keyset pagination cursor
+            limit: Pagination limit
+            role: Role the cached result was filtered for
             ttl_seconds: Cache TTL in seconds
 
         Returns:
             True if cached successfully
         """
-        if not self._ensure_connected():
+        if revision is None or not self._ensure_connected():
             return False
 
-        cache_key = f"compliance:retention:{status}:{days_threshold}"
+        cache_key = self.retention_report_key(
+            status, days_threshold, cursor_id, limit, role
+        )
         ttl = ttl_seconds or settings.CACHE_TTL_RETENTION
         try:
-            self._client.setex(cache_key, ttl, json.dumps(result, default=str))
+            self._set_versioned(
+                cache_key,
+                ttl,
+                result if isinstance(result, bytes) else self.serialize(result),
+                revision,
+            )
             return True
         except Exception as e:
             logger.error(f"Error setting retention cache: {e}")
             return False
 
-    def invalidate_retention_cache(self) -> int:
-        """
-        Invalidate all retention report cache entries.
-
-        Returns:
-            Number of keys deleted
-        """
-        if not self._ensure_connected():
-            return 0
-
-        try:
-            keys = self._client.keys("compliance:retention:*")
-            if keys:
-                return self._client.delete(*keys)
-            return 0
-        except Exception as e:
-            logger.error(f"Error invalidating retention cache: {e}")
-            return 0
-
     # ==========================================
     # Metrics and Counters
     # ==========================================
@@ -360,13 +884,13 @@ class ComplianceCacheService:
             return None
 
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = _today_str()
 
         cache_key = f"compliance:metrics:{date}"
         try:
             data = self._client.get(cache_key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.error(f"Error reading metrics cache: {e}")
         return None
@@ -392,42 +916,67 @@ class ComplianceCacheService:
             return False
 
         if date is None:
-            date = datetime.utcnow().strftime("%Y-%m-%d")
+            date = _today_str()
 
         cache_key = f"compliance:metrics:{date}"
         ttl = ttl_seconds or settings.CACHE_TTL_METRICS
         try:
-            self._client.setex(cache_key, ttl, json.dumps(metrics, default=str))
+            self._client.setex(cache_key, ttl, self.serialize(metrics))
             return True
         except Exception as e:
             logger.error(f"Error setting metrics cache: {e}")
             return False
 
-    def increment_counter(self, counter_name: str, amount: int = 1) -> int:
+    def increment_counter(
+        self,
+        counter_name: str,
+        amount: int = 1,
+        ttl_seconds: Optional[int] = None,
+    ) -> int:
         """
         Increment a counter.
 
         Args:
             counter_name: Name of the counter
             amount: Amount to increment
+            ttl_seconds: Expiry set when the counter is first created
 
         Returns:
-            New counter value
+            New counter value, or 0 if the increment was deferred
         """
+        cache_key = f"compliance:counter:{counter_name}"
+        if self._defer_write(counter=(cache_key, ttl_seconds), amount=amount):
+            return 0
         if not self._ensure_connected():
             return 0
 
-        cache_key = f"compliance:counter:{counter_name}"
         try:
-            value = self._client.incrby(cache_key, amount)
-            # Set expiry for daily counters
-            if ":" in counter_name and counter_name.split(":")[-1].startswith("20"):
-                self._client.expire(cache_key, 86400 * 7)  # Keep for 7 days
-            return value
+            if ttl_seconds is None:
+                return self._client.incrby(cache_key, amount)
+
+            # The TTL is only set once, so later increments keep it
+            return self._incr_with_ttl(keys=[cache_key], args=[amount, ttl_seconds])
         except Exception as e:
             logger.error(f"Error incrementing counter: {e}")
             return 0
 
+    def increment_daily_counter(self, counter_name: str, amount: int = 1) -> int:
+        """
+        Increment today's (UTC) instance of a daily counter.
+
+        Args:
+            counter_name: Name of the counter, without the date suffix
+            amount: Amount to increment
+
+        Returns:
+            New counter value, or 0 if the increment was deferred
+        """
+        return self.increment_counter(
+            f"{counter_name}:{_today_str()}",
+            amount,
+            ttl_seconds=DAILY_COUNTER_TTL_SECONDS,
+        )
+
     def get_counter(self, counter_name: str) -> int:
         """
         Get counter value.
@@ -453,10 +1002,102 @@ class ComplianceCacheService:
     # Event Deduplication
     # ==========================================
 
+    def claim_event(
+        self,
+        event_id: str,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Atomically claim an event for processing with a single SET NX EX.
+
+        Replaces the is_duplicate_event check, closing the race between
+        check and mark. The claim only lasts CACHE_TTL_EVENT_CLAIM, so an
+        event whose handler never finishes (e.g. a crash) is processed again
+        on redelivery; mark_event_processed extends it once handled.
+
+        Args:
+            event_id: Unique event identifier
+            ttl_seconds: TTL for the claim
+
+        Returns:
+            True if the event is new and should be processed, False if it
+            was already claimed
+        """
+        if not self._ensure_connected():
+            return True
+
+        cache_key = f"compliance:event_processed:{event_id}"
+        ttl = ttl_seconds or settings.CACHE_TTL_EVENT_CLAIM
+        try:
+            return bool(self._client.set(cache_key, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Error claiming event: {e}")
+            return True
+
+    def bulk_claim_events(
+        self,
+        event_ids: list[str],
+        ttl_seconds: Optional[int] = None,
+    ) -> list[bool]:
+        """
+        Claim a batch of events in one pipelined round-trip.
+
+        Claims are short-lived like those of claim_event, until each event
+        is marked processed.
+
+        Args:
+            event_ids: Unique event identifiers
+            ttl_seconds: TTL for the claims
+
+        Returns:
+            One flag per event id, True if the event is new and should be
+            processed, False if it was already claimed
+        """
+        if not event_ids or not self._ensure_connected():
+            return [True] * len(event_ids)
+
+        ttl = ttl_seconds or settings.CACHE_TTL_EVENT_CLAIM
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                for event_id in event_ids:
+                    pipe.set(
+                        f"compliance:event_processed:{event_id}",
+                        "1",
+                        nx=True,
+                        ex=ttl,
+                    )
+                return [bool(claimed) for claimed in pipe.execute()]
+        except Exception as e:
+            logger.error(f"Error claiming events: {e}")
+            return [True] * len(event_ids)
+
+    def release_event(self, event_id: str) -> bool:
+        """
+        Release a claimed event so a redelivery is processed again.
+
+        Args:
+            event_id: Unique event identifier
+
+        Returns:
+            True if released successfully
+        """
+        if not self._ensure_connected():
+            return False
+
+        cache_key = f"compliance:event_processed:{event_id}"
+        try:
+            self._client.delete(cache_key)
+            return True
+        except Exception as e:
+            logger.error(f"Error releasing event: {e}")
+            return False
+
     def is_duplicate_event(self, event_id: str) -> bool:
         """
         Check if an event has already been processed.
 
+        Deprecated: use claim_event, which checks and claims in one command.
+
         Args:
             event_id: Unique event identifier
 
@@ -481,6 +1122,9 @@ class ComplianceCacheService:
         """
         Mark an event as processed.
 
+        Called once a claimed event has been handled, replacing its short
+        claim with the full deduplication TTL.
+
         Args:
             event_id: Unique event identifier
             ttl_seconds: TTL for deduplication entry
@@ -521,9 +1165,9 @@ class ComplianceCacheService:
 
         cache_key = f"compliance:access_controls:{employee_id}"
         try:
-            data = self._client.get(cache_key)
+            data = self._get_indexed("access_controls", cache_key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.error(f"Error reading access controls cache: {e}")
         return None
@@ -551,7 +1195,12 @@ class ComplianceCacheService:
         cache_key = f"compliance:access_controls:{employee_id}"
         ttl = ttl_seconds or settings.CACHE_TTL_ACCESS_CONTROLS
         try:
-            self._client.setex(cache_key, ttl, json.dumps(access_controls, default=str))
+            self._set_indexed(
+                "access_controls",
+                cache_key,
+                ttl,
+                self.serialize(access_controls),
+            )
             return True
         except Exception as e:
             logger.error(f"Error setting access controls cache: {e}")
@@ -575,12 +1224,12 @@ class ComplianceCacheService:
         try:
             if employee_id:
                 cache_key = f"compliance:access_controls:{employee_id}"
-                return self._client.delete(cache_key)
-            else:
-                keys = self._client.keys("compliance:access_controls:*")
-                if keys:
-                    return self._client.delete(*keys)
-            return 0
+                with self._client.pipeline(transaction=False) as pipe:
+                    pipe.delete(cache_key)
+                    pipe.srem(self._index_key("access_controls"), cache_key)
+                    deleted, _ = pipe.execute()
+                return deleted
+            return self._invalidate_index("access_controls")
         except Exception as e:
             logger.error(f"Error invalidating access controls cache: {e}")
             return 0
@@ -596,14 +1245,20 @@ class ComplianceCacheService:
         Returns:
             Cached categories or None
         """
+        cache_key = CATEGORIES_CACHE_KEY
+        local = self._local.get(cache_key)
+        if local is not None:
+            return local
+
         if not self._ensure_connected():
             return None
 
-        cache_key = "compliance:categories"
         try:
             data = self._client.get(cache_key)
             if data:
-                return json.loads(data)
+                value = orjson.loads(data)
+                self._local.set(cache_key, value)
+                return value
         except Exception as e:
             logger.error(f"Error reading categories cache: {e}")
         return None
@@ -626,10 +1281,11 @@ class ComplianceCacheService:
         if not self._ensure_connected():
             return False
 
-        cache_key = "compliance:categories"
+        cache_key = CATEGORIES_CACHE_KEY
         ttl = ttl_seconds or settings.CACHE_TTL_CATEGORIES
         try:
-            self._client.setex(cache_key, ttl, json.dumps(categories, default=str))
+            self._client.setex(cache_key, ttl, self.serialize(categories))
+            self._local.set(cache_key, categories)
             return True
         except Exception as e:
             logger.error(f"Error setting categories cache: {e}")
@@ -642,16 +1298,83 @@ class ComplianceCacheService:
         Returns:
             True if deleted successfully
         """
+        self._local.delete(CATEGORIES_CACHE_KEY)
+
         if not self._ensure_connected():
             return False
 
         try:
-            self._client.delete("compliance:categories")
+            self._client.delete(CATEGORIES_CACHE_KEY)
             return True
         except Exception as e:
             logger.error(f"Error invalidating categories cache: {e}")
             return False
 
+    # ==========================================
+    # Data Type Cache
+    # ==========================================
+
+    def get_data_types(self) -> Optional[list[str]]:
+        """
+        Get cached distinct inventory data types.
+
+        Returns:
+            Cached data types or None
+        """
+        if not self._ensure_connected():
+            return None
+
+        try:
+            data = self._client.get(DATA_TYPES_CACHE_KEY)
+            if data:
+                return orjson.loads(data)
+        except Exception as e:
+            logger.error(f"Error reading data types cache: {e}")
+        return None
+
+    def set_data_types(
+        self,
+        data_types: list[str],
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Cache distinct inventory data types.
+
+        Args:
+            data_types: Data types to cache
+            ttl_seconds: Cache TTL in seconds
+
+        Returns:
+            True if cached successfully
+        """
+        if not self._ensure_connected():
+            return False
+
+        ttl = ttl_seconds or settings.CACHE_TTL_DATA_TYPES
+        try:
+            self._client.setex(DATA_TYPES_CACHE_KEY, ttl, orjson.dumps(data_types))
+            return True
+        except Exception as e:
+            logger.error(f"Error setting data types cache: {e}")
+            return False
+
+    def invalidate_data_types_cache(self) -> bool:
+        """
+        Invalidate the distinct data types cache.
+
+        Returns:
+            True if deleted successfully
+        """
+        if not self._ensure_connected():
+            return False
+
+        try:
+            self._client.delete(DATA_TYPES_CACHE_KEY)
+            return True
+        except Exception as e:
+            logger.error(f"Error invalidating data types cache: {e}")
+            return False
+
 
 # Global cache instance
 _cache_service: Optional[ComplianceCacheService] = None
@@ -0,0 +1,77 @@
+"""
+In-process cache of data category reference data.
+
+Data categories change rarely, so they are loaded once at startup and
+refreshed periodically instead of being queried on every data inventory
+request. Category writes invalidate the cache so the next read reloads it.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.logging import get_logger
+from app.models.data_inventory import DataCategory
+
+logger = get_logger(__name__)
+
+# Category ID -> reference fields, None until loaded
+_category_cache: Optional[dict[int, dict[str, Any]]] = None
+
+
+def refresh_category_cache() -> dict[int, dict[str, Any]]:
+    """
+    Reload all data categories from the database.
+
+    Returns:
+        The freshly loaded category mapping
+    """
+    global _category_cache
+
+    with Session(engine) as session:
+        categories = session.exec(
+            select(
+                DataCategory.id,
+                DataCategory.name,
+                DataCategory.description,
+                DataCategory.sensitivity_level,
+            )
+        ).all()
+
+    # Swap in a new dict so concurrent readers never see a partial load
+    loaded = {cat.id: cat._asdict() for cat in categories}
+    _category_cache = loaded
+    logger.debug(f"Loaded {len(loaded)} data categories")
+    return loaded
+
+
+def invalidate_category_cache() -> None:
+    """Drop the cached categories so the next read reloads them."""
+    global _category_cache
+    _category_cache = None
+
+
+def get_cached_categories() -> list[dict[str, Any]]:
+    """
+    Get data category reference data, loading it if not cached yet.
+
+    Returns:
+        List of categories with id, name, description and sensitivity_level
+    """
+    categories = _category_cache
+    if categories is None:
+        categories = refresh_category_cache()
+    return list(categories.values())
+
+
+async def refresh_categories_periodically() -> None:
+    """Refresh the category cache every CATEGORY_REFRESH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(settings.CATEGORY_REFRESH_INTERVAL)
+        try:
+            await asyncio.to_thread(refresh_category_cache)
+        except Exception as e:
+            logger.error(f"Failed to refresh data categories: {e}")
@@ -16,6 +16,15 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 3306
     DB_CHARSET: str = "utf8"
+    # Connection pool; size it for the API threadpool plus consumer workers
+    DB_POOL_SIZE: int = 16
+    DB_MAX_OVERFLOW: int = 8
+    DB_POOL_RECYCLE: int = 1800  # Recycle connections after 30 minutes
+    DB_POOL_USE_LIFO: bool = True  # Reuse warm connections, let idle ones age out
+    # Startup: backoff cap between schema-creation attempts, and how long
+    # shutdown waits for an unfinished init
+    STARTUP_RETRY_MAX_DELAY: float = 30.0
+    STARTUP_SHUTDOWN_TIMEOUT: float = 10.0
 
     # CORS Settings
     CORS_ORIGINS: str = "https://localhost,http://localhost:3000"
@@ -30,6 +39,10 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
         return [self.CORS_ORIGINS]
 
+    # Response Compression
+    GZIP_MINIMUM_SIZE: int = 1024  # Only compress bodies at least this large
+    GZIP_COMPRESS_LEVEL: int = 5
+
     # ==========================================
     # Kafka Configuration
     # ==========================================
@@ -41,6 +54,10 @@ class Settings(BaseSettings):
     KAFKA_MAX_POLL_INTERVAL_MS: int = 300000
     KAFKA_SESSION_TIMEOUT_MS: int = 45000
     KAFKA_HEARTBEAT_INTERVAL_MS: int = 15000
+    KAFKA_CONSUME_BATCH_SIZE: int = 100
+    # Threads handling a poll batch; events with the same key stay in order.
+    # 1 keeps the batch on the consumer thread
+    KAFKA_CONSUMER_WORKERS: int = 1
 
     @property
     def kafka_configured(self) -> bool:
@@ -54,6 +71,14 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    REDIS_POOL_MAX_CONNECTIONS: int = 32
+    # Entries kept by redis-py client-side caching (RESP3, Redis 6+, redis-py
+    # 5.1+); 0 disables
+    REDIS_CLIENT_CACHE_MAX_SIZE: int = 0
+    # Server settings applied on connect; empty/None leaves the server's own
+    # value alone (e.g. "allkeys-lfu" to evict cold cache entries first)
+    REDIS_MAXMEMORY_POLICY: str = ""
+    REDIS_ACTIVEDEFRAG: bool | None = None
 
     # Cache TTL Settings (in seconds)
     CACHE_TTL_INVENTORY: int = 300  # 5 minutes for data inventory
@@ -61,8 +86,17 @@ class Settings(BaseSettings):
     CACHE_TTL_RETENTION: int = 300  # 5 minutes for retention reports
     CACHE_TTL_METRICS: int = 300  # 5 minutes for metrics
     CACHE_TTL_DEDUP: int = 86400  # 24 hours for event deduplication
+    CACHE_TTL_EVENT_CLAIM: int = 300  # 5 minutes while a claimed event is handled
     CACHE_TTL_ACCESS_CONTROLS: int = 600  # 10 minutes for access controls
     CACHE_TTL_CATEGORIES: int = 3600  # 1 hour for data categories
+    CACHE_TTL_DATA_TYPES: int = 300  # 5 minutes for distinct data types
+    CACHE_STALE_WINDOW_SECONDS: int = 30  # Refresh in background this close to expiry
+    CATEGORY_REFRESH_INTERVAL: int = 300  # Reload in-process data categories
+    LOCAL_CACHE_TTL_SECONDS: int = 30  # In-process layer in front of Redis
+    LOCAL_CACHE_MAX_ENTRIES: int = 1024
+    CACHE_COMPRESS_MIN_SIZE: int = 1024  # Compress indexed payloads this large
+    CACHE_COMPRESS_LEVEL: int = 3
+    HEALTH_PING_CACHE_SECONDS: float = 2.0  # Reuse a Redis PING result in /health/redis
 
     @property
     def redis_configured(self) -> bool:
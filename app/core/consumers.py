@@ -5,23 +5,29 @@ Handles incoming events from other services to track data processing activities
 and maintain data inventory for GDPR compliance.
 """
 
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any, Optional
 
+from sqlalchemy import insert as plain_insert, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.event import listen
 from sqlmodel import Session, select
 
+from app.core import database
 from app.core.cache import get_cache_service
+from app.core.categories import invalidate_category_cache
 from app.core.config import settings
 from app.core.database import engine
-from app.core.events import (
-    EventEnvelope,
-    create_compliance_audit_event,
-)
-from app.core.kafka import KafkaConsumerService, get_producer, publish_compliance_event
+from app.core.events import EventEnvelope
+from app.core.kafka import KafkaConsumerService, get_producer
 from app.core.logging import get_logger
 from app.core.topics import KafkaTopics
 from app.models.data_inventory import DataCategory, DataInventory
-from app.models.employee_data_access import DataRetention, EmployeeDataAccess
+from app.models.employee_data_access import DataRetention
 
 logger = get_logger(__name__)
 
@@ -30,93 +36,155 @@ logger = get_logger(__name__)
 # Data Inventory Mapping
 # ==========================================
 
-# Maps event types to data inventory information
-DATA_INVENTORY_MAPPING = {
-    # User events
-    "user-created": {
-        "data_name": "User Account Data",
-        "data_type": "personal",
-        "storage_location": "user_management_service.users",
-        "purpose": "User authentication and identification",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "user-updated": {
-        "data_name": "User Account Data",
-        "data_type": "personal",
-        "storage_location": "user_management_service.users",
-        "purpose": "User authentication and identification",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    # Employee events
-    "employee-created": {
-        "data_name": "Employee Personal Data",
-        "data_type": "personal",
-        "storage_location": "employee_management_service.employees",
-        "purpose": "Human resource management and employment record keeping",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "employee-updated": {
-        "data_name": "Employee Personal Data",
-        "data_type": "personal",
-        "storage_location": "employee_management_service.employees",
-        "purpose": "Human resource management and employment record keeping",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "employee-salary-updated": {
-        "data_name": "Employee Salary Data",
-        "data_type": "sensitive",
-        "storage_location": "employee_management_service.salaries",
-        "purpose": "Payroll processing and compensation management",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "employee-salary-increment": {
-        "data_name": "Employee Salary Data",
-        "data_type": "sensitive",
-        "storage_location": "employee_management_service.salaries",
-        "purpose": "Payroll processing and compensation management",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    # Attendance events
-    "attendance-checkin": {
-        "data_name": "Attendance Records",
-        "data_type": "employment",
-        "storage_location": "attendance_management_service.attendance",
-        "purpose": "Time tracking and work hour monitoring",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "attendance-checkout": {
-        "data_name": "Attendance Records",
-        "data_type": "employment",
-        "storage_location": "attendance_management_service.attendance",
-        "purpose": "Time tracking and work hour monitoring",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    # Leave events
-    "leave-requested": {
-        "data_name": "Leave Records",
-        "data_type": "employment",
-        "storage_location": "leave_management_service.leaves",
-        "purpose": "Leave management and absence tracking",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    "leave-approved": {
-        "data_name": "Leave Records",
-        "data_type": "employment",
-        "storage_location": "leave_management_service.leaves",
-        "purpose": "Leave management and absence tracking",
-        "legal_basis": "Contract - Employment agreement",
-    },
-    # Notification events
-    "notification-sent": {
-        "data_name": "Communication Records",
-        "data_type": "operational",
-        "storage_location": "notification_service.notifications",
-        "purpose": "Communication tracking and audit",
-        "legal_basis": "Legitimate Interest - Business operations",
-    },
+
+@dataclass(frozen=True, slots=True)
+class InventoryInfo:
+    """Data inventory details recorded for an event type."""
+
+    data_name: str
+    data_type: str
+    storage_location: str
+    purpose: str
+    legal_basis: str
+
+
+# Unique index the retention upsert relies on (see DataRetention)
+RETENTION_UNIQUE_INDEX = "ix_dataretention_inventory_record"
+
+# Maps event types to data inventory information, frozen at import
+DATA_INVENTORY_MAPPING: Mapping[str, InventoryInfo] = MappingProxyType(
+    {
+        # User events
+        "user-created": InventoryInfo(
+            data_name="User Account Data",
+            data_type="personal",
+            storage_location="user_management_service.users",
+            purpose="User authentication and identification",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "user-updated": InventoryInfo(
+            data_name="User Account Data",
+            data_type="personal",
+            storage_location="user_management_service.users",
+            purpose="User authentication and identification",
+            legal_basis="Contract - Employment agreement",
+        ),
+        # Employee events
+        "employee-created": InventoryInfo(
+            data_name="Employee Personal Data",
+            data_type="personal",
+            storage_location="employee_management_service.employees",
+            purpose="Human resource management and employment record keeping",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "employee-updated": InventoryInfo(
+            data_name="Employee Personal Data",
+            data_type="personal",
+            storage_location="employee_management_service.employees",
+            purpose="Human resource management and employment record keeping",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "employee-salary-updated": InventoryInfo(
+            data_name="Employee Salary Data",
+            data_type="sensitive",
+            storage_location="employee_management_service.salaries",
+            purpose="Payroll processing and compensation management",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "employee-salary-increment": InventoryInfo(
+            data_name="Employee Salary Data",
+            data_type="sensitive",
+            storage_location="employee_management_service.salaries",
+            purpose="Payroll processing and compensation management",
+            legal_basis="Contract - Employment agreement",
+        ),
+        # Attendance events
+        "attendance-checkin": InventoryInfo(
+            data_name="Attendance Records",
+            data_type="employment",
+            storage_location="attendance_management_service.attendance",
+            purpose="Time tracking and work hour monitoring",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "attendance-checkout": InventoryInfo(
+            data_name="Attendance Records",
+            data_type="employment",
+            storage_location="attendance_management_service.attendance",
+            purpose="Time tracking and work hour monitoring",
+            legal_basis="Contract - Employment agreement",
+        ),
+        # Leave events
+        "leave-requested": InventoryInfo(
+            data_name="Leave Records",
+            data_type="employment",
+            storage_location="leave_management_service.leaves",
+            purpose="Leave management and absence tracking",
+            legal_basis="Contract - Employment agreement",
+        ),
+        "leave-approved": InventoryInfo(
+            data_name="Leave Records",
+            data_type="employment",
+            storage_location="leave_management_service.leaves",
+            purpose="Leave management and absence tracking",
+            legal_basis="Contract - Employment agreement",
+        ),
+        # Notification events
+        "notification-sent": InventoryInfo(
+            data_name="Communication Records",
+            data_type="operational",
+            storage_location="notification_service.notifications",
+            purpose="Communication tracking and audit",
+            legal_basis="Legitimate Interest - Business operations",
+        ),
+    }
+)
+
+
+# Topics deduplicated on event ID: topic -> (claim key prefix, fallback ID field)
+DEDUP_TOPICS = {
+    KafkaTopics.USER_CREATED: ("user-created", "user_id"),
+    KafkaTopics.EMPLOYEE_CREATED: ("employee-created", "employee_id"),
 }
 
 
+# ==========================================
+# Event Deduplication
+# ==========================================
+
+
+def _dedup_event_id(event_data: dict[str, Any], topic: str) -> Optional[str]:
+    """Build the deduplication claim key for an event, if its topic is deduplicated."""
+    dedup = DEDUP_TOPICS.get(topic)
+    if dedup is None:
+        return None
+
+    prefix, id_field = dedup
+    event_id = event_data.get("event_id") or event_data.get("payload", {}).get(id_field)
+    return f"{prefix}:{event_id}" if event_id else None
+
+
+def claim_event_batch(events: list[tuple[dict[str, Any], str]]) -> list[bool]:
+    """
+    Claim every deduplicated event of a poll batch in one Redis round-trip.
+
+    Claims are short-lived; handlers mark their event processed once it has
+    been handled, so an event lost to a crash mid-batch is redelivered.
+
+    Args:
+        events: (event_data, topic) pairs in poll order
+
+    Returns:
+        One flag per event, False for duplicates that should be skipped
+    """
+    claim_keys = [_dedup_event_id(event_data, topic) for event_data, topic in events]
+    to_claim = [key for key in claim_keys if key is not None]
+    if not to_claim:
+        return [True] * len(events)
+
+    claimed = iter(get_cache_service().bulk_claim_events(to_claim))
+    return [key is None or next(claimed) for key in claim_keys]
+
+
 # ==========================================
 # Event Handlers
 # ==========================================
@@ -128,13 +196,8 @@ def handle_user_created_event(event_data: dict[str, Any], topic: str) -> None:
 
     cache = get_cache_service()
 
-    # Extract event ID for deduplication
-    event_id = event_data.get("event_id") or event_data.get("payload", {}).get(
-        "user_id"
-    )
-    if event_id and cache.is_duplicate_event(f"user-created:{event_id}"):
-        logger.debug(f"Duplicate event skipped: {event_id}")
-        return
+    # Claimed by claim_event_batch before dispatch
+    claim_key = _dedup_event_id(event_data, topic)
 
     payload = event_data.get("payload", event_data)
     user_id = payload.get("user_id") or payload.get("id")
@@ -158,29 +221,31 @@ def handle_user_created_event(event_data: dict[str, Any], topic: str) -> None:
             # Create retention tracking record
             _create_retention_record(
                 session,
-                inventory_id=inventory.id,
+                inventory=inventory,
                 record_id=user_id,
                 data_subject_id=user_id,
             )
 
             session.commit()
 
-        # Mark event as processed
-        if event_id:
-            cache.mark_event_processed(f"user-created:{event_id}")
-
         # Invalidate relevant caches
-        cache.invalidate_inventory_cache()
+        cache.bump_revision("inventory")
         cache.invalidate_employee_data_cache(user_id)
 
         # Increment counter
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"data_collected:{today}")
+        cache.increment_daily_counter("data_collected")
 
         logger.info(f"User data tracking created for user {user_id}")
 
+        # Only now is the event deduplicated for the full TTL
+        if claim_key:
+            cache.mark_event_processed(claim_key)
+
     except Exception as e:
         logger.error(f"Error processing user-created event: {e}")
+        # Let a redelivery retry the event
+        if claim_key:
+            cache.release_event(claim_key)
 
 
 def handle_user_updated_event(event_data: dict[str, Any], topic: str) -> None:
@@ -224,27 +289,29 @@ def handle_user_deleted_event(event_data: dict[str, Any], topic: str) -> None:
         return
 
     try:
+        # One timestamp for the record and the published event
+        now = datetime.utcnow()
         with Session(engine) as session:
             # Mark retention record as deleted
             _mark_retention_deleted(
                 session,
                 record_id=user_id,
                 deletion_reason=deletion_reason,
+                now=now,
             )
             session.commit()
 
         # Invalidate caches
         cache.invalidate_employee_data_cache(user_id)
-        cache.invalidate_retention_cache()
+        cache.bump_revision("retention")
 
         # Increment deletion counter
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"data_deleted:{today}")
+        cache.increment_daily_counter("data_deleted")
 
         logger.info(f"User data deletion tracked for user {user_id}")
 
         # Publish compliance event
-        _publish_data_deleted_event(user_id, "user", deletion_reason)
+        _publish_data_deleted_event(user_id, "user", deletion_reason, now)
 
     except Exception as e:
         logger.error(f"Error processing user-deleted event: {e}")
@@ -256,12 +323,8 @@ def handle_employee_created_event(event_data: dict[str, Any], topic: str) -> Non
 
     cache = get_cache_service()
 
-    event_id = event_data.get("event_id") or event_data.get("payload", {}).get(
-        "employee_id"
-    )
-    if event_id and cache.is_duplicate_event(f"employee-created:{event_id}"):
-        logger.debug(f"Duplicate event skipped: {event_id}")
-        return
+    # Claimed by claim_event_batch before dispatch
+    claim_key = _dedup_event_id(event_data, topic)
 
     payload = event_data.get("payload", event_data)
     employee_id = payload.get("employee_id") or payload.get("id")
@@ -286,27 +349,30 @@ def handle_employee_created_event(event_data: dict[str, Any], topic: str) -> Non
             # Create retention tracking record
             _create_retention_record(
                 session,
-                inventory_id=inventory.id,
+                inventory=inventory,
                 record_id=employee_id,
                 data_subject_id=user_id or employee_id,
             )
 
             session.commit()
 
-        if event_id:
-            cache.mark_event_processed(f"employee-created:{event_id}")
-
-        cache.invalidate_inventory_cache()
+        cache.bump_revision("inventory")
         if user_id:
             cache.invalidate_employee_data_cache(user_id)
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"data_collected:{today}")
+        cache.increment_daily_counter("data_collected")
 
         logger.info(f"Employee data tracking created for employee {employee_id}")
 
+        # Only now is the event deduplicated for the full TTL
+        if claim_key:
+            cache.mark_event_processed(claim_key)
+
     except Exception as e:
         logger.error(f"Error processing employee-created event: {e}")
+        # Let a redelivery retry the event
+        if claim_key:
+            cache.release_event(claim_key)
 
 
 def handle_employee_updated_event(event_data: dict[str, Any], topic: str) -> None:
@@ -353,19 +419,17 @@ def handle_employee_terminated_event(event_data: dict[str, Any], topic: str) ->
         with Session(engine) as session:
             # Update retention status to indicate termination
             # Data can be retained for legal compliance period
-            statement = select(DataRetention).where(
-                DataRetention.record_id == employee_id
+            session.execute(
+                update(DataRetention)
+                .where(DataRetention.record_id == employee_id)
+                .values(
+                    retention_status="termination_retention",
+                    updated_at=datetime.utcnow(),
+                )
             )
-            retention_records = session.exec(statement).all()
-
-            for record in retention_records:
-                record.retention_status = "termination_retention"
-                record.updated_at = datetime.utcnow()
-                session.add(record)
-
             session.commit()
 
-        cache.invalidate_retention_cache()
+        cache.bump_revision("retention")
         if user_id:
             cache.invalidate_employee_data_cache(user_id)
 
@@ -377,186 +441,190 @@ def handle_employee_terminated_event(event_data: dict[str, Any], topic: str) ->
         logger.error(f"Error processing employee-terminated event: {e}")
 
 
-def handle_attendance_event(event_data: dict[str, Any], topic: str) -> None:
-    """Handle attendance events - track time and location data collection."""
-    logger.info(f"Processing attendance event from {topic}")
+def _first_field(payload: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the first present value among alternative payload field names."""
+    for field in fields:
+        value = payload.get(field)
+        if value:
+            return value
+    return None
+
+
+def _track_retention_batch(
+    events: list[dict[str, Any]],
+    topic: str,
+    label: str,
+    inventory_info: InventoryInfo,
+    subject_fields: tuple[str, ...],
+    record_fields: tuple[str, ...],
+    counter_name: str,
+) -> None:
+    """
+    Track retention records for a batch of events in one transaction.
+
+    Events without a data subject are skipped. Every other event counts
+    toward the daily counter, and those carrying a record ID get a retention
+    record, inserted together with a single commit. Database errors are
+    re-raised so the consumer leaves the group uncommitted.
+    """
+    logger.info(f"Processing {len(events)} {label.lower()} events from {topic}")
 
     cache = get_cache_service()
-    payload = event_data.get("payload", event_data)
-    employee_id = payload.get("employee_id")
-    attendance_id = payload.get("attendance_id") or payload.get("id")
+    # Record ID -> data subject, first occurrence wins like sequential handling
+    records: dict[str, str] = {}
+    tracked = 0
+    for event_data in events:
+        payload = event_data.get("payload", event_data)
+        subject_id = _first_field(payload, subject_fields)
+        if not subject_id:
+            logger.warning(f"{label} event missing {subject_fields[0]}")
+            continue
 
-    if not employee_id:
-        logger.warning("Attendance event missing employee_id")
+        tracked += 1
+        record_id = _first_field(payload, record_fields)
+        if record_id:
+            records.setdefault(str(record_id), subject_id)
+
+    if not tracked:
         return
 
     try:
         with Session(engine) as session:
             inventory = _get_or_create_data_inventory(
                 session,
-                data_name="Attendance Records",
-                data_type="employment",
-                storage_location="attendance_management_service.attendance",
-                purpose="Time tracking and work hour monitoring",
-                legal_basis="Contract - Employment agreement",
+                data_name=inventory_info.data_name,
+                data_type=inventory_info.data_type,
+                storage_location=inventory_info.storage_location,
+                purpose=inventory_info.purpose,
+                legal_basis=inventory_info.legal_basis,
             )
 
-            if attendance_id:
-                _create_retention_record(
-                    session,
-                    inventory_id=inventory.id,
-                    record_id=attendance_id,
-                    data_subject_id=employee_id,
-                )
+            _create_retention_records(session, inventory, records)
 
             session.commit()
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"attendance_records:{today}")
-
-        logger.info(f"Attendance data tracked for employee {employee_id}")
-
     except Exception as e:
-        logger.error(f"Error processing attendance event: {e}")
+        logger.error(f"Error processing {label.lower()} events: {e}")
+        # Fail the whole group so its offsets are not committed and the
+        # batch is redelivered; the upsert makes the retry idempotent
+        raise
 
+    cache.increment_daily_counter(counter_name, tracked)
 
-def handle_leave_event(event_data: dict[str, Any], topic: str) -> None:
-    """Handle leave events - track leave request data."""
-    logger.info(f"Processing leave event from {topic}")
+    logger.info(f"{label} data tracked for {tracked} events")
 
-    cache = get_cache_service()
-    payload = event_data.get("payload", event_data)
-    employee_id = payload.get("employee_id")
-    leave_id = payload.get("leave_id") or payload.get("id")
 
-    if not employee_id:
-        logger.warning("Leave event missing employee_id")
-        return
+def handle_attendance_events(events: list[dict[str, Any]], topic: str) -> None:
+    """Handle attendance events - track time and location data collection."""
+    _track_retention_batch(
+        events,
+        topic,
+        label="Attendance",
+        inventory_info=DATA_INVENTORY_MAPPING["attendance-checkin"],
+        subject_fields=("employee_id",),
+        record_fields=("attendance_id", "id"),
+        counter_name="attendance_records",
+    )
 
-    try:
-        with Session(engine) as session:
-            inventory = _get_or_create_data_inventory(
-                session,
-                data_name="Leave Records",
-                data_type="employment",
-                storage_location="leave_management_service.leaves",
-                purpose="Leave management and absence tracking",
-                legal_basis="Contract - Employment agreement",
-            )
 
-            if leave_id:
-                _create_retention_record(
-                    session,
-                    inventory_id=inventory.id,
-                    record_id=leave_id,
-                    data_subject_id=employee_id,
-                )
+def handle_leave_events(events: list[dict[str, Any]], topic: str) -> None:
+    """Handle leave events - track leave request data."""
+    _track_retention_batch(
+        events,
+        topic,
+        label="Leave",
+        inventory_info=DATA_INVENTORY_MAPPING["leave-requested"],
+        subject_fields=("employee_id",),
+        record_fields=("leave_id", "id"),
+        counter_name="leave_records",
+    )
 
-            session.commit()
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"leave_records:{today}")
+def handle_notification_events(events: list[dict[str, Any]], topic: str) -> None:
+    """Handle notification events - track communication records."""
+    _track_retention_batch(
+        events,
+        topic,
+        label="Notification",
+        inventory_info=DATA_INVENTORY_MAPPING["notification-sent"],
+        subject_fields=("recipient_id", "employee_id"),
+        record_fields=("notification_id", "id"),
+        counter_name="notifications_tracked",
+    )
 
-        logger.info(f"Leave data tracked for employee {employee_id}")
 
-    except Exception as e:
-        logger.error(f"Error processing leave event: {e}")
+def handle_generic_event(event_data: dict[str, Any], topic: str) -> None:
+    """Generic handler for unmapped events - logs for review."""
+    logger.info(f"Received event on topic {topic} (generic handler)")
 
+    event_type = event_data.get("event_type", topic)
 
-def handle_notification_event(event_data: dict[str, Any], topic: str) -> None:
-    """Handle notification events - track communication records."""
-    logger.info(f"Processing notification event from {topic}")
+    mapping = DATA_INVENTORY_MAPPING.get(event_type)
+    if mapping is None:
+        logger.debug(f"No mapping for event type {event_type} from topic {topic}")
+        return
 
-    cache = get_cache_service()
-    payload = event_data.get("payload", event_data)
-    recipient_id = payload.get("recipient_id") or payload.get("employee_id")
-    notification_id = payload.get("notification_id") or payload.get("id")
+    logger.debug(f"Event type {event_type} has mapping, processing...")
 
-    if not recipient_id:
-        logger.warning("Notification event missing recipient_id")
-        return
+    payload = event_data.get("payload", event_data)
+    record_id = (
+        payload.get("id")
+        or payload.get("user_id")
+        or payload.get("employee_id")
+        or payload.get("attendance_id")
+        or payload.get("leave_id")
+    )
 
-    try:
-        with Session(engine) as session:
-            inventory = _get_or_create_data_inventory(
-                session,
-                data_name="Communication Records",
-                data_type="operational",
-                storage_location="notification_service.notifications",
-                purpose="Communication tracking and audit",
-                legal_basis="Legitimate Interest - Business operations",
-            )
+    if record_id:
+        try:
+            with Session(engine) as session:
+                inventory = _get_or_create_data_inventory(
+                    session,
+                    data_name=mapping.data_name,
+                    data_type=mapping.data_type,
+                    storage_location=mapping.storage_location,
+                    purpose=mapping.purpose,
+                    legal_basis=mapping.legal_basis,
+                )
 
-            if notification_id:
                 _create_retention_record(
                     session,
-                    inventory_id=inventory.id,
-                    record_id=notification_id,
-                    data_subject_id=recipient_id,
+                    inventory=inventory,
+                    record_id=str(record_id),
+                    data_subject_id=payload.get("user_id")
+                    or payload.get("employee_id"),
                 )
 
-            session.commit()
+                session.commit()
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        cache.increment_counter(f"notifications_tracked:{today}")
+        except Exception as e:
+            logger.error(f"Error in generic handler for {topic}: {e}")
 
-        logger.info(f"Notification data tracked for recipient {recipient_id}")
 
-    except Exception as e:
-        logger.error(f"Error processing notification event: {e}")
-
-
-def handle_generic_event(event_data: dict[str, Any], topic: str) -> None:
-    """Generic handler for unmapped events - logs for review."""
-    logger.info(f"Received event on topic {topic} (generic handler)")
-
-    event_type = event_data.get("event_type", topic)
+# ==========================================
+# Helper Functions
+# ==========================================
 
-    # Check if we have mapping for this event type
-    if event_type in DATA_INVENTORY_MAPPING:
-        logger.debug(f"Event type {event_type} has mapping, processing...")
-        mapping = DATA_INVENTORY_MAPPING[event_type]
 
-        payload = event_data.get("payload", event_data)
-        record_id = (
-            payload.get("id")
-            or payload.get("user_id")
-            or payload.get("employee_id")
-            or payload.get("attendance_id")
-            or payload.get("leave_id")
-        )
+@dataclass(frozen=True, slots=True)
+class InventoryRef:
+    """Data inventory fields needed to attach retention records."""
 
-        if record_id:
-            try:
-                with Session(engine) as session:
-                    inventory = _get_or_create_data_inventory(
-                        session,
-                        data_name=mapping["data_name"],
-                        data_type=mapping["data_type"],
-                        storage_location=mapping["storage_location"],
-                        purpose=mapping["purpose"],
-                        legal_basis=mapping["legal_basis"],
-                    )
-
-                    _create_retention_record(
-                        session,
-                        inventory_id=inventory.id,
-                        record_id=str(record_id),
-                        data_subject_id=payload.get("user_id")
-                        or payload.get("employee_id"),
-                    )
-
-                    session.commit()
-
-            except Exception as e:
-                logger.error(f"Error in generic handler for {topic}: {e}")
-    else:
-        logger.debug(f"No mapping for event type {event_type} from topic {topic}")
+    id: int
+    retention_days: int
 
 
-# ==========================================
-# Helper Functions
-# ==========================================
+# Resolved inventory rows keyed by (data_name, storage_location), with the
+# monotonic time they expire at, and category IDs keyed by name. Category IDs
+# never change, so they live for the process lifetime; inventory rows also
+# carry retention_days, which can be edited, so they are re-read after
+# CACHE_TTL_INVENTORY. Rows are cached when read back, never straight after
+# being inserted, so a rolled back insert cannot leave a dangling ID behind.
+# The dicts are shared by the consumer worker threads without a lock: single
+# get/set calls are atomic, and two workers missing together only both query
+# and store the same row.
+_inventory_cache: dict[tuple[str, str], tuple[InventoryRef, float]] = {}
+_category_id_cache: dict[str, int] = {}
 
 
 def _get_or_create_data_inventory(
@@ -566,24 +634,36 @@ def _get_or_create_data_inventory(
     storage_location: str,
     purpose: str,
     legal_basis: str,
-) -> DataInventory:
+) -> InventoryRef:
     """Get existing or create new data inventory entry."""
-    statement = select(DataInventory).where(
+    cache_key = (data_name, storage_location)
+    cached = _inventory_cache.get(cache_key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    statement = select(DataInventory.id, DataInventory.retention_days).where(
         DataInventory.data_name == data_name,
         DataInventory.storage_location == storage_location,
     )
-    inventory = session.exec(statement).first()
+    existing = session.exec(statement).first()
 
-    if inventory:
-        return inventory
+    if existing:
+        inventory_ref = InventoryRef(existing.id, existing.retention_days)
+        _inventory_cache[cache_key] = (
+            inventory_ref,
+            time.monotonic() + settings.CACHE_TTL_INVENTORY,
+        )
+        return inventory_ref
 
     # Get or create default category
-    category = _get_or_create_category(session, data_type)
+    category_id = _get_or_create_category(session, data_type)
 
+    # Core INSERT: the new ID comes back with the statement (MySQL lastrowid)
+    # without the unit of work tracking an object nobody reads again
     inventory = DataInventory(
         data_name=data_name,
         data_type=data_type,
-        category_id=category.id,
+        category_id=category_id,
         storage_location=storage_location,
         purpose_of_processing=purpose,
         legal_basis=legal_basis,
@@ -593,14 +673,22 @@ def _get_or_create_data_inventory(
         encryption_status="encrypted",
         access_control_level="restricted",
     )
-    session.add(inventory)
-    session.flush()
+    result = session.execute(
+        insert(DataInventory).values(inventory.model_dump(exclude={"id"}))
+    )
+    # The new row may add a data type to the compliance report's list
+    listen(
+        session,
+        "after_commit",
+        lambda _: get_cache_service().invalidate_data_types_cache(),
+        once=True,
+    )
 
-    return inventory
+    return InventoryRef(result.inserted_primary_key[0], inventory.retention_days)
 
 
-def _get_or_create_category(session: Session, data_type: str) -> DataCategory:
-    """Get existing or create new data category."""
+def _get_or_create_category(session: Session, data_type: str) -> int:
+    """Get existing or create new data category, returning its ID."""
     # Map data types to categories
     category_mapping = {
         "personal": ("Personal Data", "high"),
@@ -613,111 +701,161 @@ def _get_or_create_category(session: Session, data_type: str) -> DataCategory:
         data_type, ("Other Data", "medium")
     )
 
-    statement = select(DataCategory).where(DataCategory.name == category_name)
-    category = session.exec(statement).first()
+    category_id = _category_id_cache.get(category_name)
+    if category_id is not None:
+        return category_id
+
+    statement = select(DataCategory.id).where(DataCategory.name == category_name)
+    category_id = session.exec(statement).first()
 
-    if category:
-        return category
+    if category_id is not None:
+        _category_id_cache[category_name] = category_id
+        return category_id
 
     category = DataCategory(
         name=category_name,
         description=f"Category for {data_type} data",
         sensitivity_level=sensitivity,
     )
-    session.add(category)
-    session.flush()
+    result = session.execute(
+        insert(DataCategory).values(category.model_dump(exclude={"id"}))
+    )
+    # Readers reloading before the commit would cache the list without the
+    # new row, so only invalidate once it is visible
+    listen(session, "after_commit", lambda _: invalidate_category_cache(), once=True)
 
-    return category
+    return result.inserted_primary_key[0]
 
 
 def _create_retention_record(
     session: Session,
-    inventory_id: int,
+    inventory: InventoryRef,
     record_id: str,
     data_subject_id: Optional[str] = None,
-) -> DataRetention:
+) -> None:
     """Create data retention tracking record."""
-    # Check if already exists
-    statement = select(DataRetention).where(
-        DataRetention.data_inventory_id == inventory_id,
-        DataRetention.record_id == record_id,
-    )
-    existing = session.exec(statement).first()
+    _create_retention_records(session, inventory, {record_id: data_subject_id})
 
-    if existing:
-        existing.data_last_accessed = datetime.utcnow()
-        existing.updated_at = datetime.utcnow()
-        return existing
-
-    # Get retention days from inventory
-    inventory = session.get(DataInventory, inventory_id)
-    retention_days = (
-        inventory.retention_days if inventory else settings.DEFAULT_RETENTION_DAYS
-    )
+
+def _create_retention_records(
+    session: Session,
+    inventory: InventoryRef,
+    records: dict[str, Optional[str]],
+) -> None:
+    """
+    Create data retention tracking records in bulk.
+
+    Written as one upsert on the (data_inventory_id, record_id) unique
+    index: new records are inserted, existing ones only have their access
+    time refreshed. While that index could not be created on an existing
+    database, existing records are looked up first instead.
+
+    Args:
+        session: Database session
+        inventory: Inventory the records belong to
+        records: Record ID -> data subject ID
+    """
+    if not records:
+        return
 
     now = datetime.utcnow()
-    retention = DataRetention(
-        data_inventory_id=inventory_id,
-        record_id=record_id,
-        data_created_at=now,
-        data_last_accessed=now,
-        retention_expires_at=now + timedelta(days=retention_days),
-        retention_status="active",
-        data_subject_id=data_subject_id,
-    )
-    session.add(retention)
+    retention_days = inventory.retention_days or settings.DEFAULT_RETENTION_DAYS
+
+    # Plain row dicts sharing the batch-wide columns; building a model per
+    # row only to dump it again costs more than the INSERT's parameters
+    shared = {
+        "data_inventory_id": inventory.id,
+        "data_created_at": now,
+        "data_last_accessed": now,
+        "retention_expires_at": now + timedelta(days=retention_days),
+        "retention_status": "active",
+        "created_at": now,
+        "updated_at": now,
+    }
+    rows = [
+        {**shared, "record_id": record_id, "data_subject_id": data_subject_id}
+        for record_id, data_subject_id in records.items()
+    ]
+
+    if RETENTION_UNIQUE_INDEX in database.missing_unique_indexes:
+        existing = set(
+            session.exec(
+                select(DataRetention.record_id).where(
+                    DataRetention.data_inventory_id == inventory.id,
+                    DataRetention.record_id.in_(list(records)),
+                )
+            ).all()
+        )
+        if existing:
+            session.execute(
+                update(DataRetention)
+                .where(
+                    DataRetention.data_inventory_id == inventory.id,
+                    DataRetention.record_id.in_(list(existing)),
+                )
+                .values(data_last_accessed=now, updated_at=now)
+            )
+        new_rows = [row for row in rows if row["record_id"] not in existing]
+        if new_rows:
+            session.execute(plain_insert(DataRetention), new_rows)
+        return
 
-    return retention
+    statement = insert(DataRetention).values(rows)
+    session.execute(
+        statement.on_duplicate_key_update(
+            data_last_accessed=statement.inserted.data_last_accessed,
+            updated_at=statement.inserted.updated_at,
+        )
+    )
 
 
 def _update_retention_access(session: Session, record_id: str) -> None:
     """Update last accessed time for retention records."""
-    statement = select(DataRetention).where(DataRetention.record_id == record_id)
-    records = session.exec(statement).all()
-
     now = datetime.utcnow()
-    for record in records:
-        record.data_last_accessed = now
-        record.updated_at = now
-        session.add(record)
+    session.execute(
+        update(DataRetention)
+        .where(DataRetention.record_id == record_id)
+        .values(data_last_accessed=now, updated_at=now)
+    )
 
 
 def _mark_retention_deleted(
     session: Session,
     record_id: str,
     deletion_reason: str,
+    now: Optional[datetime] = None,
 ) -> None:
-    """Mark retention records as deleted."""
-    statement = select(DataRetention).where(DataRetention.record_id == record_id)
-    records = session.exec(statement).all()
-
-    now = datetime.utcnow()
-    for record in records:
-        record.retention_status = "deleted"
-        record.marked_for_deletion = True
-        record.marked_for_deletion_at = now
-        record.deletion_completed_at = now
-        record.deletion_reason = deletion_reason
-        record.updated_at = now
-        session.add(record)
+    """Mark retention records as deleted, at now if given."""
+    now = now or datetime.utcnow()
+    session.execute(
+        update(DataRetention)
+        .where(DataRetention.record_id == record_id)
+        .values(
+            retention_status="deleted",
+            marked_for_deletion=True,
+            marked_for_deletion_at=now,
+            deletion_completed_at=now,
+            deletion_reason=deletion_reason,
+            updated_at=now,
+        )
+    )
 
 
 def _publish_data_deleted_event(
     record_id: str,
     data_type: str,
     deletion_reason: str,
+    deleted_at: Optional[datetime] = None,
 ) -> None:
     """Publish data deletion event for audit."""
     try:
-        from app.core.events import create_data_deleted_event
-
         event = EventEnvelope.create(
             event_type="compliance-data-deleted",
             payload={
                 "record_id": record_id,
                 "data_type": data_type,
                 "deletion_reason": deletion_reason,
-                "deleted_at": datetime.utcnow().isoformat(),
+                "deleted_at": (deleted_at or datetime.utcnow()).isoformat(),
                 "deleted_by": "system",
             },
         )
@@ -759,18 +897,23 @@ TOPIC_HANDLERS = {
     KafkaTopics.EMPLOYEE_CONTRACT_ENDED: handle_employee_terminated_event,
     KafkaTopics.EMPLOYEE_PROBATION_STARTED: handle_employee_updated_event,
     KafkaTopics.EMPLOYEE_PROBATION_COMPLETED: handle_employee_updated_event,
+}
+
+# Topic to batch handler mapping, for high-volume topics whose events are
+# written to the database together per poll batch
+BATCH_TOPIC_HANDLERS = {
     # Attendance events
-    KafkaTopics.ATTENDANCE_CHECKIN: handle_attendance_event,
-    KafkaTopics.ATTENDANCE_CHECKOUT: handle_attendance_event,
-    KafkaTopics.ATTENDANCE_UPDATED: handle_attendance_event,
+    KafkaTopics.ATTENDANCE_CHECKIN: handle_attendance_events,
+    KafkaTopics.ATTENDANCE_CHECKOUT: handle_attendance_events,
+    KafkaTopics.ATTENDANCE_UPDATED: handle_attendance_events,
     # Leave events
-    KafkaTopics.LEAVE_REQUESTED: handle_leave_event,
-    KafkaTopics.LEAVE_APPROVED: handle_leave_event,
-    KafkaTopics.LEAVE_REJECTED: handle_leave_event,
-    KafkaTopics.LEAVE_CANCELLED: handle_leave_event,
+    KafkaTopics.LEAVE_REQUESTED: handle_leave_events,
+    KafkaTopics.LEAVE_APPROVED: handle_leave_events,
+    KafkaTopics.LEAVE_REJECTED: handle_leave_events,
+    KafkaTopics.LEAVE_CANCELLED: handle_leave_events,
     # Notification events
-    KafkaTopics.NOTIFICATION_SENT: handle_notification_event,
-    KafkaTopics.NOTIFICATION_FAILED: handle_notification_event,
+    KafkaTopics.NOTIFICATION_SENT: handle_notification_events,
+    KafkaTopics.NOTIFICATION_FAILED: handle_notification_events,
 }
 
 
@@ -778,8 +921,14 @@ def register_all_handlers(consumer: KafkaConsumerService) -> None:
     """Register all event handlers with the consumer."""
     for topic, handler in TOPIC_HANDLERS.items():
         consumer.register_handler(topic, handler)
+    for topic, handler in BATCH_TOPIC_HANDLERS.items():
+        consumer.register_batch_handler(topic, handler)
+    consumer.register_batch_claim(claim_event_batch)
+    consumer.register_batch_context(lambda: get_cache_service().deferred_writes())
 
-    logger.info(f"Registered {len(TOPIC_HANDLERS)} event handlers")
+    logger.info(
+        f"Registered {len(TOPIC_HANDLERS) + len(BATCH_TOPIC_HANDLERS)} event handlers"
+    )
 
 
 def start_consumer() -> KafkaConsumerService:
@@ -4,7 +4,7 @@ Handles database engine creation, session management, and table initialization.
 """
 
 from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy import text
+from sqlalchemy import Connection, Index, func, inspect, select, text
 from typing import Generator
 
 from app.core.config import settings
@@ -32,6 +32,82 @@ def create_database() -> None:
         temp_engine.dispose()
 
 
+# Indexes dropped from the models, removed from existing databases once the
+# index replacing them exists: table -> (retired index, replacement)
+RETIRED_INDEXES: dict[str, list[tuple[str, str]]] = {
+    "employeedataaccess": [
+        ("ix_employeedataaccess_employee_id", "ix_employeedataaccess_employee_active")
+    ],
+}
+
+# Unique model indexes that could not be created because existing rows
+# violate them; writers relying on them must deduplicate by hand meanwhile
+missing_unique_indexes: set[str] = set()
+
+
+def find_duplicate_keys(conn: Connection, index: Index, limit: int = 20) -> list:
+    """
+    Find key values that occur more than once for a unique index.
+
+    Returns:
+        Up to limit rows of (key columns..., row count)
+    """
+    columns = list(index.columns)
+    statement = (
+        select(*columns, func.count())
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .limit(limit)
+    )
+    return [tuple(row) for row in conn.execute(statement)]
+
+
+def create_missing_indexes() -> None:
+    """
+    Create model indexes missing from tables that already exist.
+
+    create_all() only creates indexes along with new tables, so indexes
+    added to a model later would never reach existing deployments. A unique
+    index is skipped while existing rows violate it: startup never deletes
+    data, the duplicates have to be reviewed and removed by an operator
+    (see app/scripts/dedupe_retention_records.py).
+    """
+    missing_unique_indexes.clear()
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {
+                index["name"]: index["column_names"]
+                for index in inspector.get_indexes(table.name)
+            }
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                if index.unique:
+                    duplicates = find_duplicate_keys(conn, index)
+                    if duplicates:
+                        missing_unique_indexes.add(index.name)
+                        columns = ", ".join(column.name for column in index.columns)
+                        logger.error(
+                            f"Not creating unique index {index.name} on "
+                            f"{table.name}: duplicate ({columns}) values exist, "
+                            f"e.g. {duplicates}"
+                        )
+                        continue
+                index.create(conn)
+                existing[index.name] = [column.name for column in index.columns]
+                logger.info(f"Created index {index.name} on {table.name}")
+
+            for retired, replacement in RETIRED_INDEXES.get(table.name, []):
+                if retired in existing and replacement in existing:
+                    columns = [table.c[name] for name in existing[retired]]
+                    retired_index = Index(retired, *columns)
+                    # Building it attached it to the model table; detach again
+                    table.indexes.discard(retired_index)
+                    retired_index.drop(conn)
+                    logger.info(f"Dropped retired index {retired} on {table.name}")
+
+
 def create_db_and_tables() -> None:
     """
     Create database and all tables defined in SQLModel.
@@ -39,6 +115,7 @@ def create_db_and_tables() -> None:
     """
     create_database()
     SQLModel.metadata.create_all(engine)
+    create_missing_indexes()
     logger.info("Database tables created successfully")
 
 
@@ -47,7 +124,10 @@ engine = create_engine(
     settings.database_url,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
 )
 
 
@@ -5,12 +5,20 @@ Uses confluent-kafka library for reliable message handling.
 Implements graceful startup, shutdown, and error handling.
 """
 
-import json
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, Callable, Optional
 from uuid import uuid4
 
-from confluent_kafka import Consumer, KafkaError, KafkaException, Producer
+import orjson
+from confluent_kafka import (
+    Consumer,
+    KafkaError,
+    KafkaException,
+    Producer,
+    TopicPartition,
+)
 from confluent_kafka.admin import AdminClient, NewTopic
 
 from app.core.config import settings
@@ -207,7 +215,14 @@ class KafkaConsumerService:
         self._consumer: Optional[Consumer] = None
         self._running = False
         self._handlers: dict[str, Callable] = {}
+        self._batch_handlers: dict[str, Callable] = {}
+        self._batch_claim: Optional[
+            Callable[[list[tuple[dict[str, Any], str]]], list[bool]]
+        ] = None
+        self._batch_context: Optional[Callable[[], AbstractContextManager]] = None
         self._consumer_thread: Optional[threading.Thread] = None
+        # Only created when KAFKA_CONSUMER_WORKERS > 1
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def _get_consumer_config(self) -> dict[str, Any]:
         """Get consumer configuration."""
@@ -237,6 +252,52 @@ class KafkaConsumerService:
         self._handlers[topic] = handler
         logger.info(f"Registered handler for topic: {topic}")
 
+    def register_batch_handler(
+        self,
+        topic: str,
+        handler: Callable[[list[dict[str, Any]], str], None],
+    ) -> None:
+        """
+        Register a handler that receives all of a poll batch's events for a topic.
+
+        Used instead of a per-event handler where events can be written to
+        the database together.
+
+        Args:
+            topic: Topic name
+            handler: Callable that receives ([event_data, ...], topic)
+        """
+        self._batch_handlers[topic] = handler
+        logger.info(f"Registered batch handler for topic: {topic}")
+
+    def register_batch_claim(
+        self,
+        claim: Callable[[list[tuple[dict[str, Any], str]]], list[bool]],
+    ) -> None:
+        """
+        Register a callable that deduplicates a whole poll batch at once.
+
+        Args:
+            claim: Callable that receives [(event_data, topic), ...] and
+                returns one flag per event, False for duplicates to skip
+        """
+        self._batch_claim = claim
+
+    def register_batch_context(
+        self,
+        context: Callable[[], AbstractContextManager],
+    ) -> None:
+        """
+        Register a context manager factory wrapped around each poll batch.
+
+        Lets handlers defer side effects, such as cache invalidation, until
+        the whole batch has been handled.
+
+        Args:
+            context: Callable returning a fresh context manager per batch
+        """
+        self._batch_context = context
+
     def connect(self) -> None:
         """Initialize the Kafka consumer connection."""
         if self._consumer is not None:
@@ -261,6 +322,10 @@ class KafkaConsumerService:
             self._consumer_thread.join(timeout=10)
             self._consumer_thread = None
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
         if self._consumer is not None:
             try:
                 self._consumer.close()
@@ -269,31 +334,204 @@ class KafkaConsumerService:
             except Exception as e:
                 logger.error(f"Error disconnecting consumer: {e}")
 
-    def _process_message(self, msg) -> None:
-        """Process a single message."""
-        topic = msg.topic()
+    def _commit(self, msg) -> None:
+        """Commit the offset of a handled message."""
+        if not settings.KAFKA_ENABLE_AUTO_COMMIT:
+            self._consumer.commit(message=msg, asynchronous=False)
+
+    def _commit_batch(self, msgs: list, failed: Optional[list] = None) -> None:
+        """
+        Commit the offsets of a group of handled messages in one request.
+
+        Args:
+            msgs: Messages of the group, in poll order
+            failed: Messages whose handling failed; each partition is only
+                committed up to its first failure so it is redelivered
+        """
+        if settings.KAFKA_ENABLE_AUTO_COMMIT:
+            return
+
+        next_offsets: dict[tuple[str, int], int] = {}
+        for msg in msgs:
+            next_offsets[(msg.topic(), msg.partition())] = msg.offset() + 1
+        for msg in failed or ():
+            partition = (msg.topic(), msg.partition())
+            next_offsets[partition] = min(next_offsets[partition], msg.offset())
+
+        self._consumer.commit(
+            offsets=[
+                TopicPartition(topic, partition, offset)
+                for (topic, partition), offset in next_offsets.items()
+            ],
+            asynchronous=False,
+        )
 
+    def _decode_message(self, msg) -> Optional[dict[str, Any]]:
+        """Decode a message value, returning None if it is not valid JSON."""
         try:
-            value = msg.value().decode("utf-8")
-            event_data = json.loads(value)
+            # orjson parses the raw bytes and rejects invalid UTF-8 itself
+            return orjson.loads(msg.value())
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse message from {msg.topic()}: {e}")
+            return None
 
+    def _claim_batch(self, events: list[tuple[dict[str, Any], str]]) -> list[bool]:
+        """Claim a batch of events, processing everything if claiming fails."""
+        if self._batch_claim is None or not events:
+            return [True] * len(events)
+
+        try:
+            return self._batch_claim(events)
+        except Exception as e:
+            logger.error(f"Error claiming event batch: {e}")
+            return [True] * len(events)
+
+    def _handle_message(self, msg, event_data: dict[str, Any]) -> bool:
+        """Run the handler for a single decoded message, returning success."""
+        topic = msg.topic()
+
+        try:
             handler = self._handlers.get(topic)
             if handler:
                 handler(event_data, topic)
             else:
                 logger.warning(f"No handler registered for topic: {topic}")
+            return True
 
-            # Commit offset after successful processing
-            if not settings.KAFKA_ENABLE_AUTO_COMMIT:
-                self._consumer.commit(asynchronous=False)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse message from {topic}: {e}")
-            if not settings.KAFKA_ENABLE_AUTO_COMMIT:
-                self._consumer.commit(asynchronous=False)
         except Exception as e:
             logger.error(f"Error processing message from {topic}: {e}")
-            # Don't commit on processing error - will be retried
+            return False
+
+    def _process_message(self, msg, event_data: dict[str, Any]) -> None:
+        """Process a single decoded message."""
+        # Commit offset after successful processing; on error don't commit,
+        # it will be retried
+        if self._handle_message(msg, event_data):
+            self._commit(msg)
+
+    def _handle_lane(self, lane: list[tuple[Any, dict[str, Any]]]) -> list:
+        """Handle one ordering key's messages in order, returning the failures."""
+        return [msg for msg, data in lane if not self._handle_message(msg, data)]
+
+    @staticmethod
+    def _ordering_key(msg, event_data: dict[str, Any]) -> Any:
+        """
+        Key whose events must be handled in order.
+
+        Events are keyed by their data subject alone, whatever the topic, so
+        a user's created, updated and deleted events share one lane. The
+        user ID is tried first, since erasure is keyed by it and employee
+        events carry it alongside the employee ID. Events without a subject
+        fall back to the message key, then to their partition, keeping
+        Kafka's per-partition order.
+        """
+        payload = event_data.get("payload", event_data)
+        for field in ("user_id", "employee_id", "id", "recipient_id"):
+            if payload.get(field):
+                return ("subject", str(payload[field]))
+        if msg.key():
+            return ("key", msg.key())
+        return ("partition", msg.topic(), msg.partition())
+
+    def _process_batch(self, msgs: list) -> None:
+        """Process a poll batch, deduplicating it in one claim call first."""
+        decoded = [(msg, self._decode_message(msg)) for msg in msgs]
+        claimed = iter(
+            self._claim_batch(
+                [(data, msg.topic()) for msg, data in decoded if data is not None]
+            )
+        )
+        items = []
+        for msg, event_data in decoded:
+            process = event_data is not None and next(claimed)
+            if event_data is not None and not process:
+                logger.debug(f"Duplicate event skipped from {msg.topic()}")
+            items.append((msg, event_data, process))
+
+        if self._executor is not None:
+            self._process_batch_parallel(msgs, items)
+            return
+
+        # Topics with a batch handler are grouped and handled after the loop;
+        # their skipped messages are committed with the group
+        batches: dict[str, tuple[list, list[dict[str, Any]]]] = {}
+
+        # Walk the batch in order so offsets are committed in sequence
+        for msg, event_data, process in items:
+            if msg.topic() in self._batch_handlers:
+                group_msgs, group_events = batches.setdefault(msg.topic(), ([], []))
+                group_msgs.append(msg)
+                if process:
+                    group_events.append(event_data)
+            elif process:
+                self._process_message(msg, event_data)
+            else:
+                self._commit(msg)
+
+        for topic, (group_msgs, group_events) in batches.items():
+            self._process_topic_batch(topic, group_msgs, group_events)
+
+    def _process_batch_parallel(
+        self, msgs: list, items: list[tuple[Any, Optional[dict[str, Any]], bool]]
+    ) -> None:
+        """
+        Process a poll batch on the worker pool, then commit it once.
+
+        Messages are split into lanes by ordering key; each lane runs in order
+        on one worker while different keys run concurrently. Batch-handler
+        topics run once every lane has finished, as they do on the consumer
+        thread, so their tracking writes never race a subject's erasure.
+        """
+        lanes: dict[Any, list[tuple[Any, dict[str, Any]]]] = {}
+        batches: dict[str, tuple[list, list[dict[str, Any]]]] = {}
+
+        for msg, event_data, process in items:
+            if not process:
+                continue
+            if msg.topic() in self._batch_handlers:
+                group_msgs, group_events = batches.setdefault(msg.topic(), ([], []))
+                group_msgs.append(msg)
+                group_events.append(event_data)
+            else:
+                key = self._ordering_key(msg, event_data)
+                lanes.setdefault(key, []).append((msg, event_data))
+
+        futures = [
+            self._executor.submit(self._handle_lane, lane) for lane in lanes.values()
+        ]
+        failed = [msg for future in futures for msg in future.result()]
+
+        # Different batch topics touch different events and may overlap
+        batch_futures = [
+            (group_msgs, self._executor.submit(self._handle_topic_batch, topic, events))
+            for topic, (group_msgs, events) in batches.items()
+        ]
+
+        # Only commit once every worker has finished with the batch
+        for group_msgs, future in batch_futures:
+            if not future.result():
+                failed.extend(group_msgs)
+        self._commit_batch(msgs, failed)
+
+    def _handle_topic_batch(self, topic: str, events: list[dict[str, Any]]) -> bool:
+        """Hand one topic's events to its batch handler, returning success."""
+        try:
+            if events:
+                self._batch_handlers[topic](events, topic)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error processing batch from {topic}: {e}")
+            return False
+
+    def _process_topic_batch(
+        self, topic: str, msgs: list, events: list[dict[str, Any]]
+    ) -> None:
+        """Hand one topic's events to its batch handler, then commit them."""
+        # Commit offsets after successful processing; on error don't commit,
+        # they will be retried
+        if self._handle_topic_batch(topic, events):
+            self._commit_batch(msgs)
 
     def _consume_loop(self) -> None:
         """Main consumption loop."""
@@ -301,21 +539,26 @@ class KafkaConsumerService:
 
         while self._running:
             try:
-                msg = self._consumer.poll(timeout=1.0)
-
-                if msg is None:
-                    continue
-
-                if msg.error():
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
-                        logger.debug(
-                            f"Reached end of partition {msg.topic()}[{msg.partition()}]"
-                        )
-                    else:
-                        logger.error(f"Consumer error: {msg.error()}")
-                    continue
-
-                self._process_message(msg)
+                msgs = self._consumer.consume(
+                    num_messages=settings.KAFKA_CONSUME_BATCH_SIZE,
+                    timeout=1.0,
+                )
+
+                batch = []
+                for msg in msgs:
+                    if msg.error():
+                        if msg.error().code() == KafkaError._PARTITION_EOF:
+                            logger.debug(
+                                f"Reached end of partition {msg.topic()}[{msg.partition()}]"
+                            )
+                        else:
+                            logger.error(f"Consumer error: {msg.error()}")
+                        continue
+                    batch.append(msg)
+
+                if batch:
+                    with (self._batch_context or nullcontext)():
+                        self._process_batch(batch)
 
             except KafkaException as e:
                 logger.error(f"Kafka exception in consumer loop: {e}")
@@ -332,6 +575,11 @@ class KafkaConsumerService:
             return
 
         self.connect()
+        if settings.KAFKA_CONSUMER_WORKERS > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.KAFKA_CONSUMER_WORKERS,
+                thread_name_prefix="kafka-worker-compliance",
+            )
         self._running = True
         self._consumer_thread = threading.Thread(
             target=self._consume_loop,
@@ -3,8 +3,18 @@ Centralized logging configuration module.
 Provides consistent logging setup across the application.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def _stdout_handler() -> logging.Handler:
+    """Create the stdout handler with the standard format."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("      %(levelname)-5s  %(message)s"))
+    return handler
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -22,9 +32,7 @@ def setup_logger(name: str) -> logging.Logger:
 
     # Add handler only if not already present to avoid duplicates
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter("      %(levelname)-5s  %(message)s"))
-        logger.addHandler(handler)
+        logger.addHandler(_stdout_handler())
         logger.propagate = False  # Don't propagate to root logger to avoid duplicates
 
     return logger
@@ -41,3 +49,30 @@ def get_logger(name: str) -> logging.Logger:
         Configured logger instance
     """
     return setup_logger(name)
+
+
+def get_queued_logger(name: str) -> logging.Logger:
+    """
+    Get a logger whose records are written by a background thread.
+
+    Logging calls only enqueue the record, so request paths never block on
+    the output stream. Pending records are flushed at interpreter exit.
+
+    Args:
+        name: The name of the logger
+
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+
+    if not logger.handlers:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, _stdout_handler())
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
+
+    return logger
@@ -12,10 +12,13 @@ Per GDPR requirements, employees have the right to access their own data.
 
 from typing import Any, Optional
 
-from app.core.logging import get_logger
+from app.core.logging import get_logger, get_queued_logger
 
 logger = get_logger(__name__)
 
+# Access audit records are written off the request path
+audit_logger = get_queued_logger(f"{__name__}.audit")
+
 
 # Role hierarchy (higher number = higher privilege)
 ROLE_HIERARCHY = {
@@ -26,20 +29,75 @@ ROLE_HIERARCHY = {
 }
 
 # Roles that can access full compliance reports
-COMPLIANCE_ADMIN_ROLES = {"HR_Admin"}
+COMPLIANCE_ADMIN_ROLES = frozenset({"HR_Admin"})
 
 # Roles that can view data inventory
-DATA_INVENTORY_ROLES = {"HR_Admin", "HR_Manager"}
+DATA_INVENTORY_ROLES = frozenset({"HR_Admin", "HR_Manager"})
 
 # Roles that can view retention reports
-RETENTION_REPORT_ROLES = {"HR_Admin", "HR_Manager"}
+RETENTION_REPORT_ROLES = frozenset({"HR_Admin", "HR_Manager"})
 
 # Roles that can manage access controls
-ACCESS_CONTROL_ROLES = {"HR_Admin"}
+ACCESS_CONTROL_ROLES = frozenset({"HR_Admin"})
 
 # All employees can view their own data (GDPR Article 15)
 # This is enforced separately in the endpoints
 
+# Data types each role may access, built once
+_ROLE_DATA_TYPES = {
+    "HR_Admin": (
+        "personal",
+        "sensitive",
+        "employment",
+        "financial",
+        "health",
+        "operational",
+        "admin",
+    ),
+    "HR_Manager": ("personal", "employment", "operational"),
+    "manager": ("employment", "operational"),
+}
+_EMPLOYEE_DATA_TYPES = ("personal", "employment")
+
+# Base rights for all employees (over their own data)
+_BASE_GDPR_RIGHTS = {
+    "article_15_right_of_access": True,  # View own data
+    "article_16_right_to_rectification": True,  # Request corrections
+    "article_17_right_to_erasure": True,  # Request deletion
+    "article_18_right_to_restriction": True,  # Restrict processing
+    "article_20_right_to_portability": True,  # Export data
+    "article_21_right_to_object": True,  # Object to processing
+}
+
+# Full rights tables, built once; admin rights for processing requests
+_ADMIN_GDPR_RIGHTS = {
+    **_BASE_GDPR_RIGHTS,
+    "process_access_requests": True,
+    "process_deletion_requests": True,
+    "process_export_requests": True,
+    "view_data_inventory": True,
+    "view_retention_reports": True,
+    "manage_access_controls": True,
+}
+
+_DEFAULT_GDPR_RIGHTS = {
+    **_BASE_GDPR_RIGHTS,
+    "process_access_requests": False,
+    "process_deletion_requests": False,
+    "process_export_requests": False,
+    "view_data_inventory": False,
+    "view_retention_reports": False,
+    "manage_access_controls": False,
+}
+
+_ROLE_GDPR_RIGHTS = {
+    "HR_Manager": {
+        **_DEFAULT_GDPR_RIGHTS,
+        "view_data_inventory": True,
+        "view_retention_reports": True,
+    },
+}
+
 
 def get_role_level(role: str) -> int:
     """
@@ -318,25 +376,9 @@ def get_accessible_data_types_for_role(role: str) -> list[str]:
     Returns:
         List of accessible data type names
     """
-    if role == "HR_Admin":
-        return [
-            "personal",
-            "sensitive",
-            "employment",
-            "financial",
-            "health",
-            "operational",
-            "admin",
-        ]
-
-    if role == "HR_Manager":
-        return ["personal", "employment", "operational"]
-
-    if role == "manager":
-        return ["employment", "operational"]
-
-    # Employee
-    return ["personal", "employment"]
+    # Employee types unless the role has its own entry; copied so callers
+    # can't modify the shared table
+    return list(_ROLE_DATA_TYPES.get(role, _EMPLOYEE_DATA_TYPES))
 
 
 def get_gdpr_rights_for_role(role: str) -> dict[str, bool]:
@@ -352,52 +394,13 @@ def get_gdpr_rights_for_role(role: str) -> dict[str, bool]:
     Returns:
         Dictionary of GDPR rights and whether they're available
     """
-    # Base rights for all employees (over their own data)
-    rights = {
-        "article_15_right_of_access": True,  # View own data
-        "article_16_right_to_rectification": True,  # Request corrections
-        "article_17_right_to_erasure": True,  # Request deletion
-        "article_18_right_to_restriction": True,  # Restrict processing
-        "article_20_right_to_portability": True,  # Export data
-        "article_21_right_to_object": True,  # Object to processing
-    }
-
-    # Admin rights for processing requests
     if role in COMPLIANCE_ADMIN_ROLES:
-        rights.update(
-            {
-                "process_access_requests": True,
-                "process_deletion_requests": True,
-                "process_export_requests": True,
-                "view_data_inventory": True,
-                "view_retention_reports": True,
-                "manage_access_controls": True,
-            }
-        )
-    elif role == "HR_Manager":
-        rights.update(
-            {
-                "process_access_requests": False,
-                "process_deletion_requests": False,
-                "process_export_requests": False,
-                "view_data_inventory": True,
-                "view_retention_reports": True,
-                "manage_access_controls": False,
-            }
-        )
+        rights = _ADMIN_GDPR_RIGHTS
     else:
-        rights.update(
-            {
-                "process_access_requests": False,
-                "process_deletion_requests": False,
-                "process_export_requests": False,
-                "view_data_inventory": False,
-                "view_retention_reports": False,
-                "manage_access_controls": False,
-            }
-        )
+        rights = _ROLE_GDPR_RIGHTS.get(role, _DEFAULT_GDPR_RIGHTS)
 
-    return rights
+    # Copy so callers can't modify the shared tables
+    return dict(rights)
 
 
 def log_compliance_access(
@@ -430,6 +433,6 @@ def log_compliance_access(
         log_message += f", reason={reason}"
 
     if allowed:
-        logger.info(log_message)
+        audit_logger.info(log_message)
     else:
-        logger.warning(log_message)
+        audit_logger.warning(log_message)
@@ -3,8 +3,6 @@ Security module for JWT authentication using JWKS endpoint.
 Implements token validation, role/permission extraction for Asgardeo.
 """
 
-import json
-from datetime import datetime, timedelta
 from typing import Annotated, Any
 
 import jwt
@@ -1,15 +1,35 @@
+import asyncio
+import hashlib
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import case
+from sqlmodel import Session, func, select
 
 from app.api.routes.compliance import router as compliance_router
+from app.core.cache import close_cache, get_cache_service, init_cache
+from app.core.categories import refresh_categories_periodically, refresh_category_cache
 from app.core.config import settings
-from app.core.database import create_db_and_tables
+from app.core.consumers import register_all_handlers
+from app.core.database import create_db_and_tables, engine
+from app.core.kafka import get_consumer, get_producer
+from app.core.kafka import health_check as kafka_health_status
 from app.core.logging import get_logger
+from app.core.topics import KafkaTopics
+from app.models.data_inventory import DataCategory, DataInventory
+from app.models.employee_data_access import DataRetention
 
 logger = get_logger(__name__)
 
+# Topic lists are fixed for the process lifetime; root() reports them
+_SUBSCRIBED_TOPICS = KafkaTopics.all_subscribed_topics()
+_SUBSCRIBED_TOPICS_SAMPLE = _SUBSCRIBED_TOPICS[:10]
+
 # Global state for tracking service health
 service_state = {
     "kafka_connected": False,
@@ -21,10 +41,6 @@ service_state = {
 def init_kafka():
     """Initialize Kafka producer and consumer."""
     try:
-        from app.core.consumers import register_all_handlers
-        from app.core.kafka import get_consumer, get_producer
-        from app.core.topics import KafkaTopics
-
         # Initialize producer
         producer = get_producer()
         producer.connect()
@@ -45,8 +61,6 @@ def init_kafka():
 def shutdown_kafka():
     """Shutdown Kafka connections."""
     try:
-        from app.core.kafka import get_consumer, get_producer
-
         # Stop consumer
         consumer = get_consumer()
         consumer.stop()
@@ -65,8 +79,6 @@ def shutdown_kafka():
 def init_redis():
     """Initialize Redis cache."""
     try:
-        from app.core.cache import init_cache
-
         cache = init_cache()
         service_state["redis_connected"] = cache.is_connected()
         if service_state["redis_connected"]:
@@ -81,8 +93,6 @@ def init_redis():
 def shutdown_redis():
     """Shutdown Redis connection."""
     try:
-        from app.core.cache import close_cache
-
         close_cache()
         service_state["redis_connected"] = False
         logger.info("Redis cache closed")
@@ -90,37 +100,107 @@ def shutdown_redis():
         logger.error(f"Error closing Redis: {e}")
 
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    # Startup
-    logger.info("Starting Compliance Service...")
+def start_kafka(stopping: asyncio.Event):
+    """
+    Initialize Kafka, stopping it again if shutdown began meanwhile.
+
+    Runs in a worker thread, which shutdown cannot interrupt; checking here
+    rather than back on the event loop works even after the loop is gone.
+    """
+    init_kafka()
+    if stopping.is_set() and service_state["kafka_connected"]:
+        logger.info("Shutdown began while Kafka was starting, stopping it")
+        shutdown_kafka()
 
-    # Initialize database
-    logger.info("Creating database and tables...")
-    create_db_and_tables()
-    service_state["database_ready"] = True
-    logger.info("Database and tables created successfully")
 
-    # Initialize Redis cache
+async def init_dependencies(stopping: asyncio.Event):
+    """
+    Bring up the database, Redis and Kafka without holding up startup.
+
+    Schema creation is retried with backoff until it succeeds; Redis and
+    Kafka already fall back to a disconnected state on failure. Once
+    stopping is set no further step is started.
+    """
+    # Database and Redis are independent, so a slow Redis connect overlaps
+    # with schema creation
     logger.info("Initializing Redis cache...")
-    init_redis()
+    redis_init = asyncio.create_task(asyncio.to_thread(init_redis))
 
-    # Initialize Kafka
+    try:
+        logger.info("Creating database and tables...")
+        delay = 1.0
+        while True:
+            try:
+                await asyncio.to_thread(create_db_and_tables)
+                break
+            except Exception as e:
+                logger.warning(
+                    f"Database initialization failed, retrying in {delay:.0f}s: {e}"
+                )
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=delay)
+                return
+            except asyncio.TimeoutError:
+                delay = min(delay * 2, settings.STARTUP_RETRY_MAX_DELAY)
+        service_state["database_ready"] = True
+        logger.info("Database and tables created successfully")
+
+        # Load data category reference data
+        try:
+            await asyncio.to_thread(refresh_category_cache)
+        except Exception as e:
+            logger.warning(f"Failed to load data categories: {e}")
+    finally:
+        # Settle Redis before returning, so shutdown sees its final state
+        await redis_init
+
+    if stopping.is_set():
+        return
+
+    # Initialize Kafka once tables exist, since handlers write to them
     if settings.kafka_configured:
         logger.info("Initializing Kafka...")
-        init_kafka()
+        await asyncio.to_thread(start_kafka, stopping)
     else:
         logger.warning("Kafka not configured, skipping initialization")
 
     logger.info("Compliance Service startup complete")
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Startup
+    logger.info("Starting Compliance Service...")
+
+    # Serve probes right away; /health/ready reports 503 until the database
+    # is ready
+    stopping = asyncio.Event()
+    init_task = asyncio.create_task(init_dependencies(stopping))
+    category_refresh_task = asyncio.create_task(refresh_categories_periodically())
+
     yield
 
     # Shutdown
     logger.info("Compliance Service shutting down...")
 
-    # Shutdown Kafka
-    if service_state["kafka_connected"]:
+    category_refresh_task.cancel()
+
+    # Let initialization finish its current step rather than cancelling it:
+    # a thread already connecting cannot be interrupted, and its result must
+    # be known before the stop path below runs
+    stopping.set()
+    try:
+        await asyncio.wait_for(
+            asyncio.shield(init_task), timeout=settings.STARTUP_SHUTDOWN_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Dependency initialization still running at shutdown")
+    except Exception as e:
+        logger.error(f"Error during dependency initialization: {e}")
+
+    # Shutdown Kafka; while initialization is still running, start_kafka()
+    # stops the consumer itself once it has started
+    if init_task.done() and service_state["kafka_connected"]:
         shutdown_kafka()
 
     # Shutdown Redis
@@ -136,6 +216,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Compliance Service for HRMS - GDPR compliance, data inventory, and retention management",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -148,6 +229,13 @@ app.add_middleware(
     allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
+# Compress large JSON payloads; cached responses are stored uncompressed
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+
 
 # Include routers
 app.include_router(compliance_router, prefix="/api/v1")
@@ -170,6 +258,11 @@ async def detailed_health_check():
     }
 
 
+# Probe bodies never change, so they are encoded once
+_READY_BODY = orjson.dumps({"status": "ready"})
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+
+
 @app.get("/health/ready", tags=["health"])
 async def readiness_check():
     """
@@ -179,10 +272,8 @@ async def readiness_check():
     is_ready = service_state["database_ready"]
 
     if is_ready:
-        return {"status": "ready"}
+        return Response(content=_READY_BODY, media_type="application/json")
     else:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=503, detail="Service not ready")
 
 
@@ -192,7 +283,7 @@ async def liveness_check():
     Liveness probe for Kubernetes.
     Returns 200 if service is alive.
     """
-    return {"status": "alive"}
+    return Response(content=_ALIVE_BODY, media_type="application/json")
 
 
 @app.get("/health/kafka", tags=["health"])
@@ -200,9 +291,7 @@ async def kafka_health_check():
     """Kafka connection health check."""
     kafka_status = {}
     try:
-        from app.core.kafka import health_check
-
-        kafka_status = health_check()
+        kafka_status = kafka_health_status()
     except Exception as e:
         kafka_status = {"error": str(e)}
 
@@ -216,14 +305,12 @@ async def kafka_health_check():
 
 
 @app.get("/health/redis", tags=["health"])
-async def redis_health_check():
+def redis_health_check():
     """Redis connection health check."""
     connected = False
     try:
-        from app.core.cache import get_cache_service
-
         cache = get_cache_service()
-        connected = cache.is_connected()
+        connected = cache.ping()
     except Exception:
         pass
 
@@ -234,59 +321,43 @@ async def redis_health_check():
     }
 
 
+def _count_retention_status(status: str):
+    """Count retention rows in one status, as an aggregate over DataRetention."""
+    return func.count(case((DataRetention.retention_status == status, 1)))
+
+
 @app.get("/metrics/compliance", tags=["metrics"])
-async def compliance_metrics():
+def compliance_metrics():
     """
     Get compliance metrics for dashboard.
     """
     try:
-        from datetime import date
-
-        from app.core.cache import get_cache_service
-
         cache = get_cache_service()
-        today = date.today().isoformat()
+        # UTC, like the daily counter keys the consumers write
+        today = datetime.now(timezone.utc).date().isoformat()
 
         # Try to get from cache first
         cached_metrics = cache.get_compliance_metrics(today)
         if cached_metrics:
             return cached_metrics
 
-        # Calculate metrics if not cached
-        from sqlmodel import Session, func, select
-
-        from app.core.database import engine
-        from app.models.data_inventory import DataCategory, DataInventory
-        from app.models.employee_data_access import DataRetention
-
+        # Calculate metrics if not cached, in one round-trip: table totals as
+        # scalar subqueries, retention statuses counted in a single pass
         with Session(engine) as session:
-            # Count data inventory items
-            inventory_count = session.exec(
-                select(func.count()).select_from(DataInventory)
-            ).one()
-
-            # Count categories
-            category_count = session.exec(
-                select(func.count()).select_from(DataCategory)
-            ).one()
-
-            # Count retention records by status
-            active_count = session.exec(
-                select(func.count())
-                .select_from(DataRetention)
-                .where(DataRetention.retention_status == "active")
-            ).one()
-
-            expiring_count = session.exec(
-                select(func.count())
-                .select_from(DataRetention)
-                .where(DataRetention.retention_status == "expiring_soon")
-            ).one()
-
-            expired_count = session.exec(
-                select(func.count())
-                .select_from(DataRetention)
-                .where(DataRetention.retention_status == "expired")
+            (
+                inventory_count,
+                category_count,
+                active_count,
+                expiring_count,
+                expired_count,
+            ) = session.exec(
+                select(
+                    select(func.count()).select_from(DataInventory).scalar_subquery(),
+                    select(func.count()).select_from(DataCategory).scalar_subquery(),
+                    _count_retention_status("active"),
+                    _count_retention_status("expiring_soon"),
+                    _count_retention_status("expired"),
+                ).select_from(DataRetention)
             ).one()
 
         metrics = {
@@ -318,18 +389,9 @@ async def compliance_metrics():
         }
 
 
-@app.get("/", tags=["info"])
-async def root():
-    """Root endpoint with service information."""
-    subscribed_topics = []
-    try:
-        from app.core.topics import KafkaTopics
-
-        subscribed_topics = KafkaTopics.all_subscribed_topics()
-    except Exception:
-        pass
-
-    return {
+# The service description never changes while the process runs
+_ROOT_BODY = orjson.dumps(
+    {
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "description": "Compliance Service for HRMS - GDPR compliance and data management",
@@ -349,8 +411,8 @@ async def root():
             "enabled": settings.kafka_configured,
             "bootstrap_servers": settings.KAFKA_BOOTSTRAP_SERVERS,
             "consumer_group": settings.KAFKA_CONSUMER_GROUP_ID,
-            "topics_count": len(subscribed_topics),
-            "topics_sample": subscribed_topics[:10] if subscribed_topics else [],
+            "topics_count": len(_SUBSCRIBED_TOPICS),
+            "topics_sample": _SUBSCRIBED_TOPICS_SAMPLE,
         },
         "redis": {
             "configured": settings.redis_configured,
@@ -364,3 +426,21 @@ async def root():
             "article_30_records_of_processing": True,
         },
     }
+)
+
+
+_ROOT_ETAG = f'"{hashlib.blake2b(_ROOT_BODY, digest_size=8).hexdigest()}"'
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=60"}
+
+
+@app.get("/", tags=["info"])
+async def root(request: Request):
+    """Root endpoint with service information."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or _ROOT_ETAG in tags:
+            return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(
+        content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS
+    )
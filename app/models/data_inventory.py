@@ -4,6 +4,7 @@ Defines the SQLModel table structures for data inventory and categories.
 Implements GDPR Article 30 - Records of Processing Activities.
 """
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 
@@ -33,6 +34,13 @@ class DataInventory(SQLModel, table=True):
     Compliant with GDPR Article 30 - Records of Processing Activities.
     """
 
+    __table_args__ = (
+        # Inventory filters: category_id alone or with data_type
+        Index("ix_datainventory_category_type", "category_id", "data_type"),
+        # data_type alone (data inventory filter, DISTINCT data types)
+        Index("ix_datainventory_data_type", "data_type"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     data_name: str = Field(index=True, max_length=255, nullable=False)
     description: str | None = Field(default=None, max_length=2000)
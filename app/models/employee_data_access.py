@@ -3,6 +3,7 @@ Employee Data Access and Data Retention models.
 Tracks what data employees can access and implements GDPR Article 5 (Storage Limitation).
 """
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from datetime import datetime
 
@@ -14,8 +15,14 @@ class EmployeeDataAccess(SQLModel, table=True):
     Implements role-based and attribute-based access control.
     """
 
+    __table_args__ = (
+        # Active access grants for an employee (access-controls endpoint),
+        # also serves lookups on employee_id alone
+        Index("ix_employeedataaccess_employee_active", "employee_id", "is_active"),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
-    employee_id: str = Field(index=True, max_length=255, nullable=False)
+    employee_id: str = Field(max_length=255, nullable=False)
     data_inventory_id: int = Field(foreign_key="datainventory.id", nullable=False)
     access_level: str = Field(
         max_length=50, nullable=False
@@ -42,10 +49,28 @@ class DataRetention(SQLModel, table=True):
     Implements GDPR Article 5 - Storage Limitation.
     """
 
+    __table_args__ = (
+        # Pending records (deletion_completed_at IS NULL) form a contiguous
+        # prefix, so expired / expiring_soon lookups are index range seeks
+        Index(
+            "ix_dataretention_deletion_expires",
+            "deletion_completed_at",
+            "retention_expires_at",
+        ),
+        # One tracking record per data record and inventory entry; also
+        # serves the (data_inventory_id, record_id) existence lookups
+        Index(
+            "ix_dataretention_inventory_record",
+            "data_inventory_id",
+            "record_id",
+            unique=True,
+        ),
+    )
+
     id: int | None = Field(default=None, primary_key=True)
     data_inventory_id: int = Field(foreign_key="datainventory.id", nullable=False)
     record_id: str = Field(
-        max_length=255, nullable=False
+        max_length=255, nullable=False, index=True
     )  # ID of actual data record (e.g., user_id)
     data_created_at: datetime = Field(
         nullable=False
@@ -55,12 +80,14 @@ class DataRetention(SQLModel, table=True):
     )  # Last time this data was accessed
     retention_expires_at: datetime = Field(nullable=False)  # When retention period ends
     retention_status: str = Field(
-        default="active", max_length=50, nullable=False
+        default="active", max_length=50, nullable=False, index=True
     )  # active, expiring_soon, expired, deleted
     marked_for_deletion: bool = Field(default=False)
     marked_for_deletion_at: datetime | None = Field(default=None)
     deletion_completed_at: datetime | None = Field(default=None)
     deletion_reason: str | None = Field(default=None, max_length=500)
-    data_subject_id: str | None = Field(default=None, max_length=255)
+    data_subject_id: str | None = Field(
+        default=None, index=True, max_length=255
+    )  # Filtered by data-about-me
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -101,3 +101,34 @@ class DataInventorySummary(SQLModel):
     is_sensitive: bool = Field(default=False)
     access_control_level: str
     encryption_status: str
+
+
+class DataInventoryItem(DataInventoryBase):
+    """Schema for a single entry in the data inventory report."""
+
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class DataCategoryReference(SQLModel):
+    """Category reference embedded in the data inventory report."""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    sensitivity_level: str
+
+
+class DataInventoryResponse(SQLModel):
+    """Schema for the data inventory report (GDPR Article 30 - ROPA)."""
+
+    count: int
+    skip: int
+    limit: int
+    cursor_id: Optional[int] = None
+    next_cursor: Optional[int] = None
+    inventory: list[DataInventoryItem]
+    categories: list[DataCategoryReference]
+    gdpr_article: str
+    report_generated_at: datetime
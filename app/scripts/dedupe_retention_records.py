@@ -0,0 +1,82 @@
+"""
+One-off cleanup of duplicate data retention records.
+
+Databases created before the (data_inventory_id, record_id) unique index
+existed can hold several retention rows for the same record, and startup
+will not create the index while they do. This script lists the duplicates
+and, with --apply, deletes every row of a group except the oldest (lowest
+id), then creates the index.
+
+Review the listing before applying, e.g.:
+
+    python -m app.scripts.dedupe_retention_records
+    python -m app.scripts.dedupe_retention_records --apply
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from app.core.database import create_missing_indexes, engine, find_duplicate_keys
+from app.core.logging import get_logger
+from app.models.employee_data_access import DataRetention
+
+logger = get_logger(__name__)
+
+INDEX_NAME = "ix_dataretention_inventory_record"
+
+# Keeps the oldest row of every (data_inventory_id, record_id) group
+DELETE_DUPLICATES = text(
+    """
+    DELETE newer FROM dataretention AS newer
+    JOIN dataretention AS older
+      ON older.data_inventory_id = newer.data_inventory_id
+     AND older.record_id = newer.record_id
+     AND older.id < newer.id
+    """
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Delete the duplicates instead of only listing them",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=100,
+        help="Maximum number of duplicate groups to list (default: 100)",
+    )
+    args = parser.parse_args()
+
+    index = next(i for i in DataRetention.__table__.indexes if i.name == INDEX_NAME)
+
+    with engine.connect() as conn:
+        duplicates = find_duplicate_keys(conn, index, limit=args.limit)
+
+    if not duplicates:
+        logger.info("No duplicate retention records found")
+    else:
+        for data_inventory_id, record_id, count in duplicates:
+            print(f"{data_inventory_id}\t{record_id}\t{count} rows")
+        if len(duplicates) == args.limit:
+            print(f"(listing stopped at {args.limit} groups, use --limit to see more)")
+
+        if not args.apply:
+            print(
+                "Dry run, nothing deleted; re-run with --apply to keep the oldest rows"
+            )
+            return
+
+        with engine.begin() as conn:
+            deleted = conn.execute(DELETE_DUPLICATES).rowcount
+        logger.info(f"Deleted {deleted} duplicate retention records")
+
+    create_missing_indexes()
+
+
+if __name__ == "__main__":
+    main()